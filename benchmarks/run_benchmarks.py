@@ -0,0 +1,234 @@
+# File: benchmarks/run_benchmarks.py
+"""Time generation, rendering, save/load, save file listing and search, and compare with a stored baseline
+
+Run from the repository root: python benchmarks/run_benchmarks.py [-k filter] [--quick] [--json]
+    --save-baseline   store the results as the new baseline (benchmarks/baseline.json)
+Exits with status 1 when a benchmark is more than --threshold slower than its baseline.
+Baselines only mean something on the machine they were recorded on, so record one per kiosk/CI runner.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import timeit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+BASELINE_FILE = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+# A benchmark regresses when it is this much slower than the baseline (0.25 = 25%)
+DEFAULT_THRESHOLD = 0.25
+SMALL_FILE_COMBOS = 10
+HUGE_FILE_COMBOS = 100000
+LARGE_DIRECTORY_FILES = 2000
+SYNTHETIC_CATALOG_SIZE = 5000
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark: a generator that sets up, yields the function to time, then cleans up"""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+@contextlib.contextmanager
+def _in_directory(directory):
+    previous = os.getcwd()
+    os.chdir(directory)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+for _length in (2, 4, 8):
+    @benchmark(f"generate_combination[length={_length}]")
+    def _generate_one(length=_length):
+        from random_combo_generator import generate_combination
+        yield lambda: generate_combination(length, "adv", 1)
+
+for _count, _length in ((10, 4), (1000, 4), (10000, 8)):
+    @benchmark(f"generate_combinations[count={_count},length={_length}]")
+    def _generate_many(count=_count, length=_length):
+        from random_combo_generator import generate_combinations
+        yield lambda: generate_combinations(count, length, "adv", 1)
+
+
+@benchmark("display_combo[null stream]")
+def _display_combo():
+    from random_combo_generator import display_combo, generate_combination
+    combo = generate_combination(6, "adv", 1)
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        yield lambda: display_combo(combo, 1)
+
+
+@contextlib.contextmanager
+def _save_load(file_format, count):
+    from random_combo_generator import generate_combo_ids
+    combos = generate_combo_ids(count, 4, "adv", 1)
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "bench")
+        yield combos, file_name
+
+
+for _format in ("json", "ndjson", "archive"):
+    for _size, _count in (("small", SMALL_FILE_COMBOS), ("huge", HUGE_FILE_COMBOS)):
+        @benchmark(f"save_combo[{_format},{_size}]")
+        def _save(file_format=_format, count=_count):
+            from combo_manager import save_combo
+            with _save_load(file_format, count) as (combos, file_name):
+                yield lambda: save_combo(combos, "bench", file_name, file_format)
+
+        @benchmark(f"load_combo_file[{_format},{_size}]")
+        def _load(file_format=_format, count=_count):
+            from combo_manager import save_combo, load_combo_file, SAVE_FORMATS
+            with _save_load(file_format, count) as (combos, file_name):
+                save_combo(combos, "bench", file_name, file_format)
+                path = file_name + SAVE_FORMATS[file_format]
+                # Touch every combo so lazily loaded formats pay for their reads too
+                yield lambda: sum(len(combo) for combo in load_combo_file(path)[0]['combinations'])
+
+
+@contextlib.contextmanager
+def _large_directory():
+    from combo_manager import save_combo, MANIFEST_NAME
+    from random_combo_generator import generate_combo_ids
+    combos = generate_combo_ids(SMALL_FILE_COMBOS, 4, "adv", 1)
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(LARGE_DIRECTORY_FILES):
+            save_combo(combos, f"set {i}", os.path.join(directory, f"combos_{i}"))
+        yield directory, os.path.join(directory, MANIFEST_NAME)
+
+
+@benchmark(f"get_available_savefiles[{LARGE_DIRECTORY_FILES} files,manifest]")
+def _list_savefiles():
+    from combo_manager import get_available_savefiles
+    with _large_directory() as (directory, manifest):
+        with _in_directory(directory):
+            yield get_available_savefiles
+
+
+@benchmark(f"get_available_savefiles[{LARGE_DIRECTORY_FILES} files,no manifest]")
+def _list_savefiles_cold():
+    from combo_manager import get_available_savefiles
+
+    def list_cold():
+        os.remove(manifest)
+        return get_available_savefiles()
+
+    with _large_directory() as (directory, manifest):
+        with _in_directory(directory):
+            yield list_cold
+
+
+@benchmark("search_techniques[real catalog]")
+def _search_real():
+    from techniques_browser import search_techniques
+    search_techniques("hook")
+    yield lambda: [search_techniques(term) for term in ("hook", "uppercutt", "spinning back", "knee")]
+
+
+def synthetic_catalog(size, rng):
+    """size made-up technique records built from the words of the real catalog"""
+    from techniques_data import technique_info
+    words = sorted({word for record in technique_info for word in
+                    (record['name'] + " " + record.get('description', "")).lower().split() if word.isalpha()})
+    return [{"name": f"{' '.join(rng.sample(words, 3))} {i}",
+             "description": " ".join(rng.choices(words, k=20)),
+             "tip": " ".join(rng.choices(words, k=8))} for i in range(size)]
+
+
+@benchmark(f"search_techniques[synthetic catalog of {SYNTHETIC_CATALOG_SIZE}]")
+def _search_synthetic():
+    from technique_search import TechniqueSearchIndex
+    index = TechniqueSearchIndex(synthetic_catalog(SYNTHETIC_CATALOG_SIZE, random.Random(0)))
+    yield lambda: [index.search(term, 20) for term in ("hook", "uppercutt", "spinning back", "knee")]
+
+
+def run_benchmark(name, repeat):
+    """Best time per call of one benchmark, in seconds"""
+    random.seed(0)
+    setup = BENCHMARKS[name]()
+    function = next(setup)
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    setup.close()
+    return {"seconds": best, "calls_per_repeat": number}
+
+
+def machine_info():
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "machine": platform.machine(), "system": platform.system()}
+
+
+def compare(results, baseline, threshold):
+    """{name: ratio to the baseline} for the benchmarks slower than threshold allows"""
+    regressions = {}
+    for name, result in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if previous and result["seconds"] > previous["seconds"] * (1 + threshold):
+            regressions[name] = result["seconds"] / previous["seconds"]
+    return regressions
+
+
+def _format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", help="only run benchmarks whose name contains this")
+    parser.add_argument("--quick", action="store_true", help="fewer repeats (noisier)")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline file to compare with / save to")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown against the baseline (default 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if not args.filter or args.filter in name]
+    repeat = 3 if args.quick else 7
+    results = {}
+    for name in names:
+        results[name] = run_benchmark(name, repeat)
+        if not args.json:
+            print(f"{name}: {_format_time(results[name]['seconds'])}", file=sys.stderr)
+
+    report = {"machine": machine_info(), "results": results}
+    if args.save_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(report, baseline_file, indent=2)
+            baseline_file.write("\n")
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+        regressions = {}
+    else:
+        try:
+            with open(args.baseline) as baseline_file:
+                baseline = json.load(baseline_file)
+        except (OSError, ValueError):
+            baseline = {}
+        if baseline and baseline.get("machine") != report["machine"]:
+            print("Warning: the baseline was recorded on a different machine or Python", file=sys.stderr)
+        regressions = compare(results, baseline, args.threshold)
+        report["regressions"] = regressions
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    for name, ratio in regressions.items():
+        print(f"REGRESSION {name}: {ratio:.2f}x the baseline", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
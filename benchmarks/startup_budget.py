@@ -0,0 +1,61 @@
+# File: benchmarks/startup_budget.py
+"""Check cold import time of the entry points against a budget using python -X importtime
+
+Run from the repository root: python benchmarks/startup_budget.py [--runs 7] [--json]
+Exits with status 1 when an entry point's median import time is over budget.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Median cumulative import time allowed for each entry module, in milliseconds
+STARTUP_BUDGET_MS = {
+    "mtccg_main_file": 60,
+    "combo_cli": 50,
+}
+
+
+def import_time_ms(module):
+    """Cumulative import time of module (in ms) as reported by -X importtime"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    for line in reversed(result.stderr.splitlines()):
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"No importtime entry for {module}")
+
+
+def measure(runs):
+    results = {}
+    for module, budget in STARTUP_BUDGET_MS.items():
+        samples = [import_time_ms(module) for _ in range(runs)]
+        median = statistics.median(samples)
+        results[module] = {"median_ms": round(median, 2), "min_ms": round(min(samples), 2),
+                           "budget_ms": budget, "ok": median <= budget}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = measure(args.runs)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for module, result in results.items():
+            status = "ok" if result["ok"] else "OVER BUDGET"
+            print(f"{module}: {result['median_ms']} ms (budget {result['budget_ms']} ms) {status}")
+    return 0 if all(result["ok"] for result in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+# File: bulk_generation.py
+import hashlib
+import os
+import random
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from techniques_data import ID_TYPECODE
+
+# Combos per shard. Fixed (never derived from the worker count) so the same seed always gives the same
+# shards, and so the same output, on any number of cores
+SHARD_SIZE = 10000
+# Shards queued per worker; bounds memory when the pool runs ahead of the writer
+SHARDS_IN_FLIGHT_PER_WORKER = 2
+
+
+def derive_seed(seed, index):
+    """Independent 64-bit seed for stream number index of a run seeded with seed"""
+    digest = hashlib.sha256(f"{seed}:{index}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def new_seed():
+    """Fresh random seed for a run that should still be reproducible afterwards"""
+    return random.SystemRandom().getrandbits(64)
+
+
+def _shard_sizes(num_combos, shard_size):
+    full, rest = divmod(num_combos, shard_size)
+    return [shard_size] * full + ([rest] if rest else [])
+
+
+def _generate_shard(shard_index, num_combos, combo_length, difficulty, choice, mode, flow, seed):
+    """All combos of one shard as one flat array of technique IDs (cheap to send back from a worker)"""
+    rng = random.Random(derive_seed(seed, shard_index))
+    if flow:
+        from combo_markov import generate_flow_combo_ids
+        combos = generate_flow_combo_ids(num_combos, combo_length, difficulty, choice, mode, rng)
+    else:
+        from random_combo_generator import generate_combo_ids
+        combos = generate_combo_ids(num_combos, combo_length, difficulty, choice, mode, rng)
+    flat = array(ID_TYPECODE)
+    for combo in combos:
+        flat.extend(combo)
+    return flat
+
+
+def _ndjson_shard(shard_index, first_number, num_combos, combo_length, difficulty, choice, mode, flow, seed):
+    """One shard already formatted as NDJSON lines, so the formatting is spread over the workers too"""
+    from combo_stream import combo_record
+    flat = _generate_shard(shard_index, num_combos, combo_length, difficulty, choice, mode, flow, seed)
+    return "".join(combo_record(flat[start:start + combo_length], first_number + i)
+                   for i, start in enumerate(range(0, len(flat), combo_length)))
+
+
+def _run_shards(task, shard_args, workers):
+    """Yield task(*args) for every shard, in shard order, using up to workers processes"""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(shard_args) <= 1:
+        for args in shard_args:
+            yield task(*args)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        queued = iter(shard_args)
+        pending = deque(executor.submit(task, *args)
+                        for args in islice(queued, workers * SHARDS_IN_FLIGHT_PER_WORKER))
+        while pending:
+            result = pending.popleft().result()
+            args = next(queued, None)
+            if args is not None:
+                pending.append(executor.submit(task, *args))
+            yield result
+
+
+def generate_bulk_combo_ids(num_combos, combo_length, difficulty, choice, mode="category", flow=False, seed=0,
+                            workers=None, shard_size=SHARD_SIZE):
+    """Yield num_combos combos (technique ID arrays) generated across processes
+
+    The output only depends on the seed and the settings, never on workers.
+    """
+    sizes = _shard_sizes(num_combos, shard_size)
+    shard_args = [(index, size, combo_length, difficulty, choice, mode, flow, seed) for index, size in enumerate(sizes)]
+    for flat in _run_shards(_generate_shard, shard_args, workers):
+        for start in range(0, len(flat), combo_length):
+            yield flat[start:start + combo_length]
+
+
+def write_bulk_ndjson(out, num_combos, combo_length, difficulty, choice, mode="category", flow=False, seed=0,
+                      workers=None, shard_size=SHARD_SIZE):
+    """Write num_combos combos as NDJSON to out (same lines as combo_stream.write_ndjson) and return the count"""
+    sizes = _shard_sizes(num_combos, shard_size)
+    shard_args = [(index, index * shard_size + 1, size, combo_length, difficulty, choice, mode, flow, seed)
+                  for index, size in enumerate(sizes)]
+    for chunk in _run_shards(_ndjson_shard, shard_args, workers):
+        out.write(chunk)
+    out.flush()
+    return num_combos
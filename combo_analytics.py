@@ -0,0 +1,129 @@
+# File: combo_analytics.py
+import json
+import os
+from collections import Counter
+from combo_manager import atomic_write, get_savefile_index, load_combo_file
+from instrumentation import timed
+from techniques_data import technique_kinds, technique_table
+
+# Per-file counts, so re-running after a new save only reads the files that changed
+ANALYTICS_CACHE_NAME = ".mtccg_analytics"
+CACHE_VERSION = 1
+
+
+def file_aggregate(combinations):
+    """Technique, kind and per-position counts of one file's combos (JSON ready, keyed by technique name)"""
+    techniques = Counter()
+    positions = []
+    combos = 0
+    for combo in combinations:
+        combos += 1
+        techniques.update(combo)
+        while len(positions) < len(combo):
+            positions.append(Counter())
+        for position, technique in enumerate(combo):
+            positions[position][technique] += 1
+
+    def names(counts):
+        return {technique_table[technique] if isinstance(technique, int) else technique: count
+                for technique, count in counts.items()}
+
+    technique_counts = names(techniques)
+    kinds = Counter()
+    for name, count in technique_counts.items():
+        kinds[technique_kinds.get(name, "unknown")] += count
+    return {"combos": combos, "techniques_total": sum(techniques.values()), "techniques": technique_counts,
+            "kinds": dict(kinds), "positions": [names(counts) for counts in positions]}
+
+
+def _read_cache(directory):
+    try:
+        with open(os.path.join(directory, ANALYTICS_CACHE_NAME), "r") as cache_file:
+            cache = json.load(cache_file)
+        return cache.get("files", {}) if cache.get("version") == CACHE_VERSION else {}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _write_cache(directory, entries):
+    try:
+        atomic_write(os.path.join(directory, ANALYTICS_CACHE_NAME),
+                     json.dumps({"version": CACHE_VERSION, "files": entries}, separators=(",", ":")))
+    except OSError:
+        # Only a cache, the next run just reads every file again
+        pass
+
+
+@timed("analytics.library")
+def library_analytics(directory='.'):
+    """Technique, kind and position frequencies over every save file in directory
+
+    Only files whose size or mtime changed since the last run are loaded; "files_read" says how many.
+    """
+    cache = _read_cache(directory)
+    entries = {}
+    files_read = 0
+    # Files the manifest has to parse anyway are counted while they are loaded, not read a second time
+    loaded = {}
+
+    def count_loaded(file_name, combo_data):
+        loaded[file_name] = file_aggregate(combo_data['combinations'])
+
+    for save_file in get_savefile_index(directory, on_load=count_loaded):
+        file_name = save_file['filename']
+        cached = cache.get(file_name)
+        if file_name not in loaded and cached and cached.get("size") == save_file["size"] \
+                and cached.get("mtime") == save_file["mtime"]:
+            entries[file_name] = cached
+            continue
+        aggregate = loaded.get(file_name)
+        if aggregate is None:
+            combo_data, message = load_combo_file(os.path.join(directory, file_name))
+            if combo_data is None:
+                continue
+            aggregate = file_aggregate(combo_data['combinations'])
+        entries[file_name] = {"size": save_file["size"], "mtime": save_file["mtime"], "aggregate": aggregate}
+        files_read += 1
+    if files_read or entries.keys() != cache.keys():
+        _write_cache(directory, entries)
+
+    techniques = Counter()
+    kinds = Counter()
+    positions = []
+    combos = techniques_total = 0
+    for entry in entries.values():
+        aggregate = entry["aggregate"]
+        combos += aggregate["combos"]
+        techniques_total += aggregate["techniques_total"]
+        techniques.update(aggregate["techniques"])
+        kinds.update(aggregate["kinds"])
+        for position, counts in enumerate(aggregate["positions"]):
+            if position == len(positions):
+                positions.append(Counter())
+            positions[position].update(counts)
+    return {
+        "files": len(entries),
+        "files_read": files_read,
+        "combos": combos,
+        "techniques_total": techniques_total,
+        "techniques": dict(techniques.most_common()),
+        "kinds": dict(kinds.most_common()),
+        "positions": [dict(counts.most_common()) for counts in positions],
+    }
+
+
+def format_analytics(analytics, top=10):
+    """Readable report of library_analytics results"""
+    total = analytics["techniques_total"] or 1
+    lines = [f"{analytics['combos']} combos, {analytics['techniques_total']} techniques in {analytics['files']} files",
+             "", "Most drilled techniques:"]
+    for name, count in list(analytics["techniques"].items())[:top]:
+        lines.append(f"  {count:>8}  {count / total:6.1%}  {name}")
+    lines += ["", "By kind:"]
+    for kind, count in analytics["kinds"].items():
+        lines.append(f"  {count:>8}  {count / total:6.1%}  {kind.replace('_', ' ')}")
+    lines += ["", "Most common by position:"]
+    for position, counts in enumerate(analytics["positions"], 1):
+        favourites = ", ".join(f"{name} ({count})" for name, count in list(counts.items())[:3])
+        lines.append(f"  {position:>2}. {favourites}")
+    return "\n".join(lines) + "\n"
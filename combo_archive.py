@@ -0,0 +1,116 @@
+# File: combo_archive.py
+"""Memory-mapped combo archive (.mtca): technique-ID records with an offset index for O(1) random access
+
+Layout (little endian):
+    header   magic "MTCA", version, ID width in bytes, reserved, metadata length, combo count, index offset
+    metadata JSON with the name and creation date of the set
+    records  the technique IDs of every combo, back to back
+    index    count + 1 file offsets, combo i is the bytes between offsets i and i + 1
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime
+from combo_manager import atomic_open
+from techniques_data import ID_TYPECODE
+
+ARCHIVE_MAGIC = b"MTCA"
+ARCHIVE_VERSION = 1
+ARCHIVE_EXTENSION = ".mtca"
+_HEADER = struct.Struct("<4sBBHIQQ")
+_OFFSET = struct.Struct("<Q")
+_TYPECODES = {1: "B", 2: "H"}
+
+
+def write_archive(file_name, combinations, user_name, created=None):
+    """Write combos (an iterable of technique-ID arrays, consumed lazily) to an archive and return the count"""
+    created = created or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    metadata = json.dumps({"name": user_name, "created": created}, separators=(",", ":")).encode()
+    width = array(ID_TYPECODE).itemsize
+    with atomic_open(file_name, "wb") as archive_file:
+        archive_file.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, width, 0, len(metadata), 0, 0))
+        archive_file.write(metadata)
+        position = _HEADER.size + len(metadata)
+        offsets = array("Q", [position])
+        for combo in combinations:
+            if not isinstance(combo, array) or combo.typecode != ID_TYPECODE:
+                combo = array(ID_TYPECODE, combo)
+            if sys.byteorder == "big" and width > 1:
+                combo = array(ID_TYPECODE, combo)
+                combo.byteswap()
+            archive_file.write(combo.tobytes())
+            position += len(combo) * width
+            offsets.append(position)
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        archive_file.write(offsets.tobytes())
+        archive_file.seek(0)
+        archive_file.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, width, 0, len(metadata),
+                                        len(offsets) - 1, position))
+    return len(offsets) - 1
+
+
+class ComboArchive:
+    """Read-only view of an archive; combos are read from the memory map only when accessed"""
+
+    def __init__(self, file_name):
+        with open(file_name, "rb") as archive_file:
+            size = os.fstat(archive_file.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError("Not a combo archive")
+            self._map = mmap.mmap(archive_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, width, _, metadata_length, self._count, self._index = _HEADER.unpack_from(self._map, 0)
+        if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION or width not in _TYPECODES:
+            self._map.close()
+            raise ValueError("Not a combo archive")
+        if self._index + (self._count + 1) * _OFFSET.size > size:
+            self._map.close()
+            raise ValueError("Archive is truncated")
+        self._typecode = _TYPECODES[width]
+        self._width = width
+        self.metadata = json.loads(self._map[_HEADER.size:_HEADER.size + metadata_length])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._map.close()
+
+    def __len__(self):
+        return self._count
+
+    def _offset(self, i):
+        return _OFFSET.unpack_from(self._map, self._index + i * _OFFSET.size)[0]
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(self._count))]
+        if item < 0:
+            item += self._count
+        if not 0 <= item < self._count:
+            raise IndexError("combo number out of range")
+        start, end = struct.unpack_from("<2Q", self._map, self._index + item * _OFFSET.size)
+        combo = array(self._typecode)
+        combo.frombytes(self._map[start:end])
+        if sys.byteorder == "big" and self._width > 1:
+            combo.byteswap()
+        return combo
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def page(self, page_number, page_size):
+        """Combos of a 1-based page"""
+        start = (page_number - 1) * page_size
+        return self[start:start + page_size]
+
+    @property
+    def total_techniques(self):
+        return (self._offset(self._count) - self._offset(0)) // self._width
@@ -0,0 +1,484 @@
+# File: combo_cli.py
+import argparse
+import sys
+from techniques_data import decode_combo
+
+# Each command imports only the modules it needs, so a one-shot "generate" starts fast
+
+
+def format_text(combinations, label="Combo"):
+    """Plain (uncolored) text version of a list of combos"""
+    from combo_renderer import ComboRenderer
+    return ComboRenderer(color=False).render_session(combinations, label=label)
+
+
+def format_json(combinations):
+    import json
+    return json.dumps([decode_combo(combo) for combo in combinations], indent=2) + "\n"
+
+
+def write_combinations(combinations, output_format, out, label="Combo"):
+    if output_format == "ndjson":
+        from combo_stream import write_ndjson
+        write_ndjson(combinations, out)
+    elif output_format == "json":
+        out.write(format_json(combinations))
+    else:
+        out.write(format_text(combinations, label))
+
+
+def save_if_requested(args, combinations):
+    if not args.save:
+        return 0
+    from combo_manager import save_combo
+    success, message = save_combo(combinations, args.name or args.save, args.save, args.save_format, args.append)
+    print(message, file=sys.stderr)
+    return 0 if success else 1
+
+
+def journal_session(kind, combinations, settings=None):
+    """Journal a headless session the way the menus do (see session_journal)"""
+    from session_journal import record_session
+    record_session(kind, combinations, settings)
+
+
+def generate_for_args(args):
+    """Pick the generator for the generate options; returns (combos, error message)"""
+    kind_constraints = args.require or args.start_with or args.end_with
+    repeat_constraints = args.no_immediate_repeat or args.no_repeat_within
+    if sum(map(bool, (args.flow, kind_constraints, repeat_constraints))) > 1:
+        return None, "--flow, --require/--start-with/--end-with and --no-*-repeat can't be combined"
+    import random
+    rng = random if args.seed is None else random.Random(args.seed)
+
+    if kind_constraints:
+        from combo_space import ComboSpace
+        try:
+            space = ComboSpace(args.difficulty, args.choice, args.length, args.require, args.start_with, args.end_with)
+            return space.sample_many(args.count, rng, unique=args.unique), None
+        except ValueError as e:
+            return None, str(e)
+    if args.seed is not None and not (args.unique or repeat_constraints):
+        from seeded_combos import SeededCombos
+        return SeededCombos.generate(args.count, args.length, args.difficulty, args.choice, args.mode, args.flow,
+                                     args.seed), None
+    if args.flow and not args.unique:
+        from combo_markov import generate_flow_combo_ids
+        return generate_flow_combo_ids(args.count, args.length, args.difficulty, args.choice, args.mode), None
+    if args.flow:
+        return None, "--flow can't be combined with --unique"
+    if args.unique or repeat_constraints:
+        from unique_combos import ComboSpaceTooSmall, generate_constrained_combo_ids, generate_unique_combo_ids
+        generate = generate_unique_combo_ids if args.unique else generate_constrained_combo_ids
+        try:
+            return generate(args.count, args.length, args.difficulty, args.choice, args.mode,
+                            args.no_immediate_repeat, args.no_repeat_within, rng), None
+        except ComboSpaceTooSmall as e:
+            return None, str(e)
+    from random_combo_generator import generate_combo_ids
+    return generate_combo_ids(args.count, args.length, args.difficulty, args.choice, args.mode), None
+
+
+def cmd_generate(args):
+    plain = not (args.flow or args.unique or args.no_immediate_repeat or args.no_repeat_within or args.require or
+                 args.start_with or args.end_with)
+    settings = {"difficulty": args.difficulty, "choice": args.choice}
+    if args.format == "ndjson" and not args.save and plain and args.seed is None:
+        # No need to hold anything in memory when the combos only go to stdout; seeded, so the journal
+        # only keeps the seed and settings
+        from combo_stream import write_ndjson
+        from seeded_combos import SeededCombos
+        combinations = SeededCombos.generate(args.count, args.length, args.difficulty, args.choice, args.mode)
+        write_ndjson(combinations.stream(), sys.stdout)
+        journal_session("training", combinations, settings)
+        return 0
+    combinations, error = generate_for_args(args)
+    if error:
+        print(error, file=sys.stderr)
+        return 1
+    write_combinations(combinations, args.format, sys.stdout)
+    journal_session("training", combinations, settings)
+    return save_if_requested(args, combinations)
+
+
+def cmd_count(args):
+    from combo_space import ComboSpace
+    try:
+        space = ComboSpace(args.difficulty, args.choice, args.length, args.require, args.start_with, args.end_with)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    print(space.count)
+    return 0
+
+
+def templates_for_args(args):
+    """Compiled templates from the template argument or --template-file; returns (templates, error message)"""
+    if args.template_file:
+        from combo_manager import load_template_file
+        template_data, message = load_template_file(args.template_file)
+        return (template_data['templates'], None) if template_data else (None, message)
+    if not args.template:
+        return None, "Give a template or --template-file"
+    from combo_templates import parse_template
+    try:
+        return [parse_template(args.template)], None
+    except ValueError as e:
+        return None, str(e)
+
+
+def cmd_custom(args):
+    templates, error = templates_for_args(args)
+    if error:
+        print(error, file=sys.stderr)
+        return 1
+    if args.save_template:
+        from combo_manager import save_templates
+        success, message = save_templates(templates, args.name or args.save_template, args.save_template)
+        print(message, file=sys.stderr)
+        if not success:
+            return 1
+    # -n re-rolls every template that many times; combos alternate between the templates
+    if args.seed is not None:
+        from seeded_combos import SeededCombos
+        combinations = SeededCombos.custom([template.items for template in templates], args.count * len(templates),
+                                           args.seed)
+    else:
+        rolls = [template.reroll(args.count) for template in templates]
+        combinations = [combo for group in zip(*rolls) for combo in group]
+    write_combinations(combinations, args.format, sys.stdout, "Custom Combination")
+    journal_session("custom", combinations)
+    return save_if_requested(args, combinations)
+
+
+def cmd_load(args):
+    from combo_manager import load_combo_file
+    combo_data, message = load_combo_file(args.file)
+    if not combo_data:
+        print(f"Error: {message}", file=sys.stderr)
+        return 1
+    combinations = combo_data['combinations']
+    start = max(args.start, 1)
+    end = len(combinations) if args.limit is None else start - 1 + args.limit
+    if args.format == "text":
+        sys.stdout.write(f"=== LOADED COMBOS: {combo_data['name']} ===\n")
+        from combo_renderer import ComboRenderer
+        sys.stdout.write(ComboRenderer(color=False).render_session(combinations[start - 1:end], start=start))
+    else:
+        write_combinations(combinations[start - 1:end], args.format, sys.stdout)
+    return 0
+
+
+def cmd_search(args):
+    from techniques_browser import search_techniques_ranked
+    matches = search_techniques_ranked(args.term, args.limit)
+    if not matches:
+        print("No matches found!", file=sys.stderr)
+        return 1
+    for name, score in matches:
+        print(f"{score:.3f}\t{name}" if args.scores else name)
+    return 0
+
+
+def cmd_export(args):
+    from combo_manager import load_combo_file
+    combo_data, message = load_combo_file(args.file)
+    if not combo_data:
+        print(f"Error: {message}", file=sys.stderr)
+        return 1
+    if args.format == "archive":
+        if not args.output:
+            print("Archives need an output file (-o)", file=sys.stderr)
+            return 1
+        from combo_archive import write_archive
+        write_archive(args.output, combo_data['combinations'], combo_data['name'], combo_data.get('created'))
+        return 0
+    if args.output:
+        with open(args.output, "w") as out:
+            write_combinations(combo_data['combinations'], args.format, out)
+    else:
+        write_combinations(combo_data['combinations'], args.format, sys.stdout)
+    return 0
+
+
+def cmd_check(args):
+    from techniques_data import find_category_problems, find_record_problems
+    from technique_info_data import technique_info
+    problems = find_category_problems() + find_record_problems(technique_info)
+    for problem in problems:
+        print(problem)
+    if not problems:
+        print("Technique data is consistent")
+    return 1 if problems else 0
+
+
+def cmd_bulk(args):
+    from bulk_generation import new_seed, write_bulk_ndjson
+    seed = new_seed() if args.seed is None else args.seed
+    print(f"Seed: {seed}", file=sys.stderr)
+    settings = (args.count, args.length, args.difficulty, args.choice, args.mode, args.flow, seed, args.workers)
+    if args.output:
+        with open(args.output, "w") as out:
+            write_bulk_ndjson(out, *settings)
+    else:
+        write_bulk_ndjson(sys.stdout, *settings)
+    return 0
+
+
+def cmd_timer(args):
+    import json
+    from round_timer import run_rounds
+    if args.seed is not None or args.flow:
+        from seeded_combos import SeededCombos
+        combos = SeededCombos.generate(10 ** 9, args.length, args.difficulty, args.choice, args.mode, args.flow,
+                                       args.seed)
+    else:
+        from combo_stream import stream_combinations
+        combos = stream_combinations(None, args.length, args.difficulty, args.choice, args.mode, batch_size=64)
+    events_out = None
+    if args.events == "-":
+        events_out = sys.stdout
+    elif args.events:
+        events_out = open(args.events, "w")
+    try:
+        summary = run_rounds(combos, args.rounds, args.round_length, args.rest, args.interval,
+                             display=not args.no_display and args.events != "-", events_out=events_out)
+    finally:
+        if events_out not in (None, sys.stdout):
+            events_out.close()
+    print(f"Timing jitter: {json.dumps(summary)}", file=sys.stderr)
+    return 0
+
+
+def cmd_journal(args):
+    import session_journal
+    directory = args.dir or session_journal.journal_directory()
+    if args.action == "compact":
+        before, after = session_journal.compact_journal(directory, before=args.before)
+        print(f"{before} segments compacted to {after}", file=sys.stderr)
+        return 0
+    if args.action == "rebuild":
+        import os
+        os.makedirs(args.output_dir, exist_ok=True)
+        written = session_journal.rebuild_savefiles(args.output_dir, directory, args.since)
+        print(f"{len(written)} save files written to {args.output_dir}", file=sys.stderr)
+        return 0
+    # Sessions are numbered in journal order (after --since), so "journal replay 3" is the third one listed
+    records = (record for record in session_journal.iter_journal(directory)
+               if not args.since or record.get("time", "") >= args.since)
+    found = False
+    for number, record in enumerate(records, 1):
+        if args.session and args.session not in (str(number), record["session"]):
+            continue
+        found = True
+        try:
+            combinations = session_journal.session_combos(record)
+        except ValueError as e:
+            print(f"{number}\t{record['session']}: {e}", file=sys.stderr)
+            continue
+        if args.action == "list":
+            print(f"{number}\t{record.get('time')}\t{record.get('kind')}\t{len(combinations)} combos\t"
+                  f"{record['session']}")
+        else:
+            write_combinations(combinations, args.format, sys.stdout,
+                               "Custom Combination" if record.get("kind") == "custom" else "Combo")
+    if args.session and not found:
+        print(f"No session {args.session} in the journal", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_analytics(args):
+    from combo_analytics import library_analytics, format_analytics
+    analytics = library_analytics(args.directory)
+    if args.format == "json":
+        import json
+        sys.stdout.write(json.dumps(analytics, indent=2) + "\n")
+    else:
+        sys.stdout.write(format_analytics(analytics, args.top))
+    return 0
+
+
+def cmd_stats(args):
+    import json
+    from instrumentation import format_stats
+    try:
+        with open(args.file) as stats_file:
+            stats = json.load(stats_file)
+    except (OSError, ValueError) as e:
+        print(f"Error reading stats: {e}", file=sys.stderr)
+        return 1
+    sys.stdout.write(format_stats(stats))
+    return 0
+
+
+def cmd_serve(args):
+    from combo_server import run
+    run(args.host, args.port, args.directory)
+    return 0
+
+
+def add_drill_arguments(parser):
+    parser.add_argument("-d", "--difficulty", choices=["beg", "adv"], default="beg")
+    parser.add_argument("-c", "--choice", type=int, choices=range(1, 7), default=1,
+                        help="drill: 1 random, 2 punches/elbows, 3 kicks/knees, 4 punches/kicks, 5 knees/elbows, "
+                             "6 fake outs (adv only)")
+    parser.add_argument("-m", "--mode", choices=["category", "technique"], default="category",
+                        help="category picks a category, then a technique in it; technique makes every technique "
+                             "equally likely. Ignored with --require/--start-with/--end-with, which make every "
+                             "valid combo equally likely")
+
+
+def add_kind_arguments(parser):
+    parser.add_argument("--require", action="append", default=[], metavar="KIND",
+                        help="kind that must appear at least once (punches, kicks, elbows, knees, fakes), repeatable")
+    parser.add_argument("--start-with", metavar="KIND", help="kind of the first technique")
+    parser.add_argument("--end-with", metavar="KIND", help="kind of the last technique")
+
+
+def add_output_arguments(parser, default="text", extra_formats=()):
+    parser.add_argument("-f", "--format", choices=["text", "json", "ndjson", *extra_formats], default=default)
+
+
+def add_save_arguments(parser):
+    parser.add_argument("--save", metavar="FILENAME", help="also save the combos (extension added if missing)")
+    parser.add_argument("--save-format", choices=["json", "ndjson", "archive"], default="json",
+                        help="ndjson is compact and can be appended to, archive is read with random access")
+    parser.add_argument("--append", action="store_true", help="add the combos to an existing save file")
+    parser.add_argument("--name", help="name of the combo set (defaults to the filename)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="mtccg", description="Muay Thai combo generator (no prompts)")
+    parser.add_argument("--stats", nargs="?", const="-", metavar="FILE",
+                        help="time the hot paths and dump the stats as JSON at exit (stderr, or FILE)")
+    parser.add_argument("--profile", metavar="FILE", help="profile the command with cProfile into FILE (.pstats)")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    generate = subcommands.add_parser("generate", help="generate random combinations")
+    add_drill_arguments(generate)
+    generate.add_argument("-n", "--count", type=int, default=1, help="number of combinations")
+    generate.add_argument("-l", "--length", type=int, default=4, help="techniques per combination")
+    generate.add_argument("--flow", action="store_true",
+                          help="pick each technique based on the previous one (sides, range, stance)")
+    generate.add_argument("--unique", action="store_true", help="never repeat a whole combination")
+    generate.add_argument("--no-immediate-repeat", action="store_true",
+                          help="never use the same technique twice in a row")
+    generate.add_argument("--no-repeat-within", action="store_true",
+                          help="never use the same technique twice in one combination")
+    generate.add_argument("--seed", type=int,
+                          help="reproducible combos; saved files then only store the seed and settings")
+    add_kind_arguments(generate)
+    add_output_arguments(generate)
+    add_save_arguments(generate)
+    generate.set_defaults(handler=cmd_generate)
+
+    count = subcommands.add_parser("count", help="count the different combos a setting can produce")
+    add_drill_arguments(count)
+    count.add_argument("-l", "--length", type=int, default=4, help="techniques per combination")
+    add_kind_arguments(count)
+    count.set_defaults(handler=cmd_count)
+
+    custom = subcommands.add_parser("custom", help="resolve a custom combo template")
+    custom.add_argument("template", nargs="?", help='template such as "jab > cross > random:kicks > {knee|elbow} x2" '
+                                                    '(or the old "jab,cross,random_kicks")')
+    custom.add_argument("-n", "--count", type=int, default=1, help="combinations per template (re-rolls)")
+    custom.add_argument("--template-file", metavar="FILE",
+                        help="use the templates in FILE (.mtct, or a text file with one template per line)")
+    custom.add_argument("--save-template", metavar="FILENAME", help="save the template(s) to re-roll later")
+    custom.add_argument("--seed", type=int, help="reproducible combos")
+    add_output_arguments(custom)
+    add_save_arguments(custom)
+    custom.set_defaults(handler=cmd_custom)
+
+    load = subcommands.add_parser("load", help="show a saved combo file")
+    load.add_argument("file")
+    load.add_argument("--start", type=int, default=1, help="first combo number to show")
+    load.add_argument("--limit", type=int, help="how many combos to show")
+    add_output_arguments(load)
+    load.set_defaults(handler=cmd_load)
+
+    search = subcommands.add_parser("search", help="search techniques (typo tolerant, best match first)")
+    search.add_argument("term")
+    search.add_argument("--limit", type=int, help="show at most this many results")
+    search.add_argument("--scores", action="store_true", help="print the match score before each name")
+    search.set_defaults(handler=cmd_search)
+
+    export = subcommands.add_parser("export", help="convert a saved combo file")
+    export.add_argument("file")
+    add_output_arguments(export, default="ndjson", extra_formats=["archive"])
+    export.add_argument("-o", "--output", help="output file (stdout by default)")
+    export.set_defaults(handler=cmd_export)
+
+    check = subcommands.add_parser("check", help="check the technique lists against the technique records")
+    check.set_defaults(handler=cmd_check)
+
+    bulk = subcommands.add_parser("bulk", help="generate lots of combos as NDJSON on every core, reproducible by seed")
+    add_drill_arguments(bulk)
+    bulk.add_argument("-n", "--count", type=int, default=1000, help="number of combinations")
+    bulk.add_argument("-l", "--length", type=int, default=4, help="techniques per combination")
+    bulk.add_argument("--flow", action="store_true", help="pick each technique based on the previous one")
+    bulk.add_argument("--seed", type=int, help="same seed and options give the same output on any number of cores")
+    bulk.add_argument("-w", "--workers", type=int, help="worker processes (all cores by default)")
+    bulk.add_argument("-o", "--output", help="output file (stdout by default)")
+    bulk.set_defaults(handler=cmd_bulk)
+
+    timer = subcommands.add_parser("timer", help="timed rounds that call out a combo every few seconds")
+    add_drill_arguments(timer)
+    timer.add_argument("-l", "--length", type=int, default=3, help="techniques per combination")
+    timer.add_argument("--rounds", type=int, default=3)
+    timer.add_argument("--round-length", type=float, default=180, metavar="SECONDS")
+    timer.add_argument("--rest", type=float, default=60, metavar="SECONDS")
+    timer.add_argument("--interval", type=float, default=4, metavar="SECONDS", help="time between callouts")
+    timer.add_argument("--flow", action="store_true", help="pick each technique based on the previous one")
+    timer.add_argument("--seed", type=int, help="call out the same combos every time")
+    timer.add_argument("--events", metavar="FILE",
+                       help="also write every event as NDJSON to FILE for external displays (- for stdout)")
+    timer.add_argument("--no-display", action="store_true", help="don't show the rounds in the terminal")
+    timer.set_defaults(handler=cmd_timer)
+
+    journal = subcommands.add_parser("journal", help="list, replay, compact or rebuild save files from the session journal")
+    journal.add_argument("action", choices=["list", "replay", "compact", "rebuild"])
+    journal.add_argument("session", nargs="?",
+                         help="list/replay: only this session, by its number in 'journal list' or its ID (default all)")
+    journal.add_argument("--dir", help="journal folder (default .mtccg_journal or MTCCG_JOURNAL_DIR)")
+    journal.add_argument("--since", metavar="DATE", help='only sessions from this time on, e.g. "2026-01-31"')
+    journal.add_argument("--before", metavar="DATE", help="compact: drop sessions older than this")
+    journal.add_argument("--output-dir", default=".", help="rebuild: folder for the save files")
+    add_output_arguments(journal)
+    journal.set_defaults(handler=cmd_journal)
+
+    analytics = subcommands.add_parser("analytics", help="which techniques, kinds and positions the saved combos drill most")
+    analytics.add_argument("--directory", default=".", help="folder with the save files")
+    analytics.add_argument("--top", type=int, default=10, help="how many techniques to list")
+    analytics.add_argument("-f", "--format", choices=["text", "json"], default="text")
+    analytics.set_defaults(handler=cmd_analytics)
+
+    stats = subcommands.add_parser("stats", help="show a stats file written by --stats FILE or MTCCG_STATS")
+    stats.add_argument("file")
+    stats.set_defaults(handler=cmd_stats)
+
+    serve = subcommands.add_parser("serve", help="serve combos, save files and search as JSON over HTTP")
+    serve.add_argument("--host", default="127.0.0.1", help="address to listen on (0.0.0.0 for the whole LAN)")
+    serve.add_argument("--port", type=int, default=8080)
+    serve.add_argument("--directory", default=".", help="folder with the save files")
+    serve.set_defaults(handler=cmd_serve)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if getattr(args, "count", 1) < 1 or getattr(args, "length", 1) < 1:
+        print("Count and length must be at least 1", file=sys.stderr)
+        return 2
+    import os
+    from instrumentation import enable, profiled
+    if args.stats:
+        enable(args.stats)
+    with profiled(args.profile or os.environ.get("MTCCG_PROFILE")):
+        return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,276 @@
 # File: combo_manager.py
 import json
+from array import array
+from contextlib import contextmanager
 from datetime import datetime
-from colorama import init, Fore, Style
 import os
-from pathlib import Path
-init()
+import sys
+import tempfile
+from techniques_data import ID_TYPECODE, decode_combo
+from instrumentation import timed
 
-def save_combo(combinations_data, user_name, file_name):
+SAVE_FORMATS = {"json": ".json", "ndjson": ".ndjson", "archive": ".mtca"}
+TEMPLATE_EXTENSION = ".mtct"
+# Index of the save files in a directory, so listing them doesn't mean parsing every file
+MANIFEST_NAME = ".mtccg_manifest"
+# Bumped when files the manifest cached as invalid may load now, so they are looked at again
+MANIFEST_VERSION = 2
+# Technique-ID records are little endian, ID_WIDTH bytes per technique; files store the width they were
+# written with ("id_width"), files from before that always used one byte
+ID_WIDTH = array(ID_TYPECODE).itemsize
+_ID_TYPECODES = {1: "B", 2: "H"}
+
+
+def _id_typecode(id_width):
+    try:
+        return _ID_TYPECODES[id_width]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unsupported technique ID width: {id_width!r}") from None
+
+
+def encode_combo_record(combo, id_width=ID_WIDTH):
+    """One combo as stored on disk: a little endian hex string of technique IDs, or the list of names"""
+    if not isinstance(combo, array):
+        return list(combo)
+    combo = array(_id_typecode(id_width), combo)
+    if sys.byteorder == "big" and id_width > 1:
+        combo.byteswap()
+    return combo.tobytes().hex()
+
+
+def decode_combo_record(record, id_width=1):
+    """A combo stored by encode_combo_record with id_width bytes per technique, as an ID_TYPECODE array"""
+    if not isinstance(record, str):
+        return record
+    combo = array(_id_typecode(id_width), bytes.fromhex(record))
+    if sys.byteorder == "big" and id_width > 1:
+        combo.byteswap()
+    return combo if combo.typecode == ID_TYPECODE else array(ID_TYPECODE, combo)
+
+
+@contextmanager
+def atomic_open(file_name, mode="w"):
+    """Open a temp file next to file_name that is renamed over it once the block finishes, so a crash
+    never leaves half a file (it gets the usual permissions, not mkstemp's owner-only ones)"""
+    directory = os.path.dirname(os.path.abspath(file_name))
+    fd, temp_name = tempfile.mkstemp(prefix=".tmp-", suffix=os.path.basename(file_name), dir=directory)
+    try:
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_name, 0o666 & ~umask)
+        with os.fdopen(fd, mode) as temp_file:
+            yield temp_file
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_name, file_name)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+
+
+def atomic_write(file_name, text):
+    """Write text to file_name atomically (see atomic_open)"""
+    with atomic_open(file_name) as temp_file:
+        temp_file.write(text)
+
+
+def drop_torn_tail(file_name, block_size=4096):
+    """Cut off a partial last line left behind by an interrupted append"""
+    with open(file_name, "r+b") as file:
+        end = file.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - block_size)
+            file.seek(start)
+            block = file.read(position - start)
+            newline = block.rfind(b"\n")
+            if newline != -1:
+                if start + newline + 1 < end:
+                    file.truncate(start + newline + 1)
+                return
+            position = start
+
+
+def _ndjson_lines(combinations_data, id_width=ID_WIDTH):
+    """NDJSON records of the combos, plus how many combos and techniques they hold"""
+    lines = []
+    total_techniques = 0
+    for combo in combinations_data:
+        total_techniques += len(combo)
+        lines.append(json.dumps(encode_combo_record(combo, id_width), separators=(",", ":")) + "\n")
+    return "".join(lines), len(lines), total_techniques
+
+
+def _streamed_lines(combinations_data, first_number):
+    """Lines in the form combo_stream writes, numbered on from first_number"""
+    from combo_stream import combo_record
+    lines = []
+    total_techniques = 0
+    for combo_number, combo in enumerate(combinations_data, first_number):
+        total_techniques += len(combo)
+        lines.append(combo_record(combo, combo_number))
+    return "".join(lines), len(lines), total_techniques
+
+
+def _last_line(file_name, block_size=4096):
+    """The last line of a file that ends with a newline"""
+    with open(file_name, "rb") as file:
+        position = file.seek(0, os.SEEK_END)
+        tail = b""
+        while position > 0:
+            start = max(0, position - block_size)
+            file.seek(start)
+            tail = file.read(position - start) + tail
+            newline = tail.rfind(b"\n", 0, len(tail) - 1)
+            if newline != -1:
+                return tail[newline + 1:]
+            position = start
+        return tail
+
+
+@timed("io.save_combo")
+def save_combo(combinations_data, user_name, file_name, file_format="json", append=False):
     try:
-        if not file_name.endswith('.json'):
-            file_name = file_name + '.json'
+        extension = SAVE_FORMATS[file_format]
+        if not file_name.endswith(extension):
+            file_name = file_name + extension
+        created = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        if file_format == "archive":
+            # Memory-mapped archive, see combo_archive; it is always written whole
+            if append and os.path.exists(file_name):
+                return False, "Archives can't be appended to, save a new one instead"
+            from combo_archive import write_archive
+            write_archive(file_name, combinations_data, user_name, created)
+            update_manifest(file_name)
+            return True, "File saved successfully"
+
+        if file_format == "ndjson":
+            # Header line followed by one compact record per combo, so new combos can simply be appended
+            if append and os.path.exists(file_name):
+                previous_stat = os.stat(file_name)
+                drop_torn_tail(file_name)
+                with open(file_name, "r") as ndjson_file:
+                    header = json.loads(ndjson_file.readline())
+                if _is_streamed(header):
+                    # Streamed output keeps its {"combo": n, "techniques": [...]} lines and numbering
+                    lines, total_combos, total_techniques = _streamed_lines(
+                        combinations_data, json.loads(_last_line(file_name))["combo"] + 1)
+                else:
+                    # New records must use the ID width the file was started with
+                    lines, total_combos, total_techniques = _ndjson_lines(combinations_data,
+                                                                          header.get("id_width", 1))
+                with open(file_name, "a") as ndjson_file:
+                    ndjson_file.write(lines)
+                    ndjson_file.flush()
+                    os.fsync(ndjson_file.fileno())
+                update_manifest(file_name, total_combos=total_combos, total_techniques=total_techniques,
+                                previous_stat=previous_stat)
+                return True, "Combinations appended successfully"
+
+            header = {"name": user_name, "created": created, "format": "mtccg-ndjson", "id_width": ID_WIDTH}
+            lines, total_combos, total_techniques = _ndjson_lines(combinations_data)
+            atomic_write(file_name, json.dumps(header, separators=(",", ":")) + "\n" + lines)
+            update_manifest(file_name, user_name, created, total_combos, total_techniques)
+            return True, "File saved successfully"
+
+        if append and os.path.exists(file_name):
+            existing, message = load_combo_file(file_name)
+            if existing is None:
+                return False, f"Error saving file: {message}"
+            user_name = existing['name']
+            combinations_data = list(existing['combinations']) + list(combinations_data)
+
+        if getattr(combinations_data, "seed", None) is not None and not append:
+            # Seeded combos are stored as their seed and settings and regenerated when loaded
+            data_to_save = {"name": user_name, "created": created, "encoding": "seeded",
+                            "total_techniques": combinations_data.total_techniques, **combinations_data.to_record()}
+            atomic_write(file_name, json.dumps(data_to_save, indent=2))
+            update_manifest(file_name, user_name, created, len(combinations_data), combinations_data.total_techniques)
+            return True, "File saved successfully"
 
         data_to_save = {
             "name": user_name,
-            "created": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "created": created,
             "combinations": combinations_data,
             "total_combos": len(combinations_data),
             "total_techniques": sum(len(inner_list) for inner_list in combinations_data),
         }
 
-        with open(file_name, "w") as json_file:
-            json.dump(data_to_save, json_file, indent=2)
+        # Combos held as technique IDs are stored as one hex string each instead of a list of names
+        if combinations_data and all(isinstance(combo, array) for combo in combinations_data):
+            data_to_save["encoding"] = "technique_ids"
+            data_to_save["id_width"] = ID_WIDTH
+            data_to_save["combinations"] = [encode_combo_record(combo) for combo in combinations_data]
+        else:
+            data_to_save["combinations"] = [decode_combo(combo) for combo in combinations_data]
+
+        atomic_write(file_name, json.dumps(data_to_save, indent=2))
+        update_manifest(file_name, user_name, created, data_to_save["total_combos"], data_to_save["total_techniques"])
 
         return True, "File saved successfully"
     except Exception as e:
         return False, f"Error saving file: {str(e)}"
 
+
+@timed("io.save_templates")
+def save_templates(templates, user_name, file_name):
+    """Save custom combo templates (lists of technique names/random_* placeholders) to re-roll later"""
+    try:
+        if not file_name.endswith(TEMPLATE_EXTENSION):
+            file_name = file_name + TEMPLATE_EXTENSION
+        data_to_save = {
+            "name": user_name,
+            "created": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "format": "mtccg-templates",
+            "templates": [list(getattr(template, "items", template)) for template in templates],
+        }
+        atomic_write(file_name, json.dumps(data_to_save, indent=2))
+        return True, "Templates saved successfully"
+    except Exception as e:
+        return False, f"Error saving templates: {str(e)}"
+
+
+@timed("io.load_template_file")
+def load_template_file(filename):
+    """Load a template file; 'templates' holds compiled ComboTemplate objects
+
+    .mtct files are written by save_templates, any other file is read as template text, one per line.
+    """
+    from combo_templates import compile_template, parse_template_lines, MAX_REPORTED_PROBLEMS
+    try:
+        with open(filename, 'r') as file:
+            if not filename.endswith(TEMPLATE_EXTENSION):
+                templates, problems = parse_template_lines(file)
+                if problems:
+                    more = len(problems) - MAX_REPORTED_PROBLEMS
+                    return None, "\n".join(problems[:MAX_REPORTED_PROBLEMS] + ([f"...and {more} more"] if more > 0 else []))
+                if not templates:
+                    return None, "No templates in file"
+                return {
+                    'name': os.path.basename(filename),
+                    'created': None,
+                    'templates': templates
+                }, "Templates loaded successfully"
+            data = json.load(file)
+        if data.get('format') != "mtccg-templates" or not isinstance(data.get('templates'), list):
+            return None, "Invalid template file format"
+        return {
+            'name': data.get('name'),
+            'created': data.get('created'),
+            'templates': [compile_template(template) for template in data['templates']]
+        }, "Templates loaded successfully"
+    except FileNotFoundError:
+        return None, "File not found"
+    except json.JSONDecodeError:
+        return None, "File is corrupted or invalid JSON"
+    except (TypeError, ValueError) as e:
+        return None, f"Invalid template: {str(e)}"
+
+
 def get_save_preferences():
+    from colorama import Fore, Style
     save_choice = input(Fore.MAGENTA +"Do you want to save these combinations?"+ Style.BRIGHT + "(y/n)"  + Style.RESET_ALL + Fore.MAGENTA + ": " + Style.RESET_ALL).lower()
 
     if save_choice != 'y':
@@ -41,29 +285,182 @@ def get_save_preferences():
         'filename': filename
     }
 
-def get_available_savefiles():
+def _is_savefile_name(file_name):
+    return not file_name.startswith(".") and file_name.endswith(tuple(SAVE_FORMATS.values()))
+
+
+def _read_manifest(directory):
     try:
-        json_files = list(Path('.').glob('*.json'))
-        if not json_files:
-            return []
+        with open(os.path.join(directory, MANIFEST_NAME), "r") as manifest_file:
+            manifest = json.load(manifest_file)
+        return manifest.get("files", {}) if manifest.get("version") == MANIFEST_VERSION else {}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _write_manifest(directory, entries):
+    try:
+        atomic_write(os.path.join(directory, MANIFEST_NAME), json.dumps({"version": MANIFEST_VERSION, "files": entries}))
+    except OSError:
+        # The manifest is only a cache, listing still works (just slower) without it
+        pass
+
+
+def _manifest_entry(path, stat_result, on_load=None):
+    """Summary of one save file for the manifest (invalid files are kept too, so they aren't re-read)"""
+    entry = {"size": stat_result.st_size, "mtime": stat_result.st_mtime_ns}
+    combo_data, message = load_combo_file(path)
+    if combo_data is None:
+        entry["valid"] = False
+        return entry
+    if on_load is not None:
+        on_load(os.path.basename(path), combo_data)
+    combinations = combo_data['combinations']
+    entry.update({
+        "valid": True,
+        "name": combo_data['name'],
+        "created": combo_data.get('created'),
+        "total_combos": len(combinations),
+        "total_techniques": getattr(combinations, "total_techniques", None) or sum(len(combo) for combo in combinations),
+    })
+    return entry
 
-        return [file.name for file in json_files]
+
+def update_manifest(file_name, name=None, created=None, total_combos=None, total_techniques=None, previous_stat=None):
+    """Refresh the manifest entry of a single save file (called after every save)
+
+    The entry is built from the counts of what was just written instead of reading the file back. After an
+    append (previous_stat is the file's stat from before it) they are added to the previous entry, as long as
+    that entry still matches the file; only without counts, or a stale entry, is the file loaded again.
+    """
+    directory = os.path.dirname(os.path.abspath(file_name))
+    entries = _read_manifest(directory)
+    key = os.path.basename(file_name)
+    stat_result = os.stat(file_name)
+    entry = None
+    if total_combos is not None and previous_stat is None:
+        entry = {"valid": True, "name": name, "created": created, "total_combos": total_combos,
+                 "total_techniques": total_techniques}
+    elif total_combos is not None:
+        previous = entries.get(key)
+        if (previous and previous.get("valid") and previous.get("size") == previous_stat.st_size
+                and previous.get("mtime") == previous_stat.st_mtime_ns):
+            entry = dict(previous, total_combos=previous["total_combos"] + total_combos,
+                         total_techniques=previous["total_techniques"] + total_techniques)
+    if entry is None:
+        entry = _manifest_entry(file_name, stat_result)
+    else:
+        entry.update(size=stat_result.st_size, mtime=stat_result.st_mtime_ns)
+    entries[key] = entry
+    _write_manifest(directory, entries)
+
+
+@timed("io.savefile_index")
+def get_savefile_index(directory='.', on_load=None):
+    """Return the manifest entries of the save files in directory, newest first
+
+    Only files whose size or mtime changed since the manifest was written get parsed again; on_load(filename,
+    combo_data) is called for each of those, so a caller that needs their combos too doesn't load them twice.
+    """
+    entries = _read_manifest(directory)
+    current = {}
+    changed = False
+    with os.scandir(directory) as files:
+        for file in files:
+            if not _is_savefile_name(file.name) or not file.is_file():
+                continue
+            stat_result = file.stat()
+            entry = entries.get(file.name)
+            if entry is None or entry.get("size") != stat_result.st_size or entry.get("mtime") != stat_result.st_mtime_ns:
+                entry = _manifest_entry(file.path, stat_result, on_load)
+                changed = True
+            current[file.name] = entry
+    if changed or len(current) != len(entries):
+        _write_manifest(directory, current)
+
+    index = [dict(entry, filename=file_name) for file_name, entry in current.items() if entry.get("valid")]
+    index.sort(key=lambda entry: (entry.get("created") or "", entry["mtime"]), reverse=True)
+    return index
+
+
+def get_available_savefiles():
+    try:
+        return [entry['filename'] for entry in get_savefile_index()]
     except Exception as e:
         return []
 
+def _is_streamed(first_record):
+    """Whether an NDJSON file starting with this record is streamed output rather than a save file"""
+    return isinstance(first_record, dict) and "techniques" in first_record and "format" not in first_record
+
+
+def _load_ndjson(file, filename):
+    header = json.loads(file.readline())
+    if _is_streamed(header):
+        # Streamed output (generate/export/bulk -f ndjson): a {"combo": n, "techniques": [...]} record per
+        # line and no header, so the file name stands in for the set's name
+        combinations = [header["techniques"]]
+        read_record = lambda record: record["techniques"]
+        header = {"name": os.path.splitext(os.path.basename(filename))[0], "created": None}
+    else:
+        id_width = header.get("id_width", 1)
+        read_record = lambda record: decode_combo_record(record, id_width)
+        combinations = []
+    for line in file:
+        try:
+            combinations.append(read_record(json.loads(line)))
+        except json.JSONDecodeError:
+            # A torn last line from an interrupted append is dropped, anything earlier is corruption
+            if line.endswith("\n"):
+                raise
+    header['combinations'] = combinations
+    return header
+
+
+@timed("io.load_combo_file")
 def load_combo_file(filename):
     try:
+        if filename.endswith(SAVE_FORMATS["archive"]):
+            # Combos stay in the memory-mapped file and are read one by one when accessed
+            from combo_archive import ComboArchive
+            archive = ComboArchive(filename)
+            return {
+                'name': archive.metadata['name'],
+                'created': archive.metadata.get('created'),
+                'combinations': archive
+            }, "File loaded successfully"
+
         with open(filename, 'r') as file:
-            data = json.load(file)
+            if filename.endswith(SAVE_FORMATS["ndjson"]):
+                data = _load_ndjson(file, filename)
+            else:
+                data = json.load(file)
+
+        if data.get('encoding') == "seeded" and 'name' in data:
+            from seeded_combos import SeededCombos, DataChanged
+            try:
+                combinations = SeededCombos.from_record(data)
+            except DataChanged as e:
+                return None, str(e)
+            return {
+                'name': data['name'],
+                'created': data.get('created'),
+                'combinations': combinations
+            }, "File loaded successfully"
 
-        #
         if 'name' not in data or 'combinations' not in data:
             return None, "Invalid save file format"
 
 
+        combinations = data['combinations']
+        if data.get('encoding') == "technique_ids":
+            id_width = data.get('id_width', 1)
+            combinations = [decode_combo_record(combo, id_width) for combo in combinations]
+
         return {
             'name': data['name'],
-            'combinations': data['combinations']
+            'created': data.get('created'),
+            'combinations': combinations
         }, "File loaded successfully"
 
     except FileNotFoundError:
@@ -0,0 +1,102 @@
+# File: combo_markov.py
+import random
+from array import array
+from functools import lru_cache
+from instrumentation import timed, incr
+from combo_registry import AliasSampler, get_sampler, drill_key
+from techniques_data import ID_TYPECODE, RANGES, technique_metadata, technique_kinds
+
+# How much a transition's base probability is scaled when the next technique...
+REPEAT_FACTOR = 0.1              # ...is the same technique again
+SAME_LEG_FACTOR = 0.3            # ...is a kick or knee off the leg that just kicked
+SWITCH_SIDE_FACTOR = 1.5         # ...comes from the other side, keeping the combo flowing
+RANGE_JUMP_FACTOR = 0.4          # ...jumps between long and close range with nothing in between
+STANCE_CHANGE_FACTOR = 0.2       # ...changes the stance again right after a spinning/jumping/switch technique
+
+_LEG_KINDS = ("kicks", "knees")
+
+
+def transition_factor(previous, following):
+    """Flow factor for throwing technique following right after technique previous"""
+    if previous == following:
+        return REPEAT_FACTOR
+    previous_side, previous_range, previous_stance_change = technique_metadata[previous]
+    side, technique_range, stance_change = technique_metadata[following]
+
+    factor = 1.0
+    if "both" not in (previous_side, side):
+        if previous_side != side:
+            factor *= SWITCH_SIDE_FACTOR
+        elif technique_kinds[previous] in _LEG_KINDS and technique_kinds[following] in _LEG_KINDS:
+            factor *= SAME_LEG_FACTOR
+    if abs(RANGES.index(previous_range) - RANGES.index(technique_range)) > 1:
+        factor *= RANGE_JUMP_FACTOR
+    if previous_stance_change and stance_change:
+        factor *= STANCE_CHANGE_FACTOR
+    return factor
+
+
+class MarkovComboEngine:
+    """Combo generator where each technique is drawn based on the one before it
+
+    Every row of the transition matrix gets its own alias table, so each draw stays O(1).
+    """
+
+    def __init__(self, sampler):
+        self.start = sampler
+        self.names = sampler.names
+        self.ids = sampler.ids
+        self.rows = [AliasSampler(self.names, [probability * transition_factor(previous, following)
+                                               for following, probability in zip(self.names, sampler.probabilities)])
+                     for previous in self.names]
+
+    def transition_matrix(self):
+        """{technique: {next technique: probability}}"""
+        return {previous: row.distribution() for previous, row in zip(self.names, self.rows)}
+
+    def generate_positions(self, combo_length, rng=random):
+        """One combo as sampler positions"""
+        position = self.start.draw(rng)
+        combo = [position]
+        rows = self.rows
+        for _ in range(combo_length - 1):
+            position = rows[position].draw(rng)
+            combo.append(position)
+        return combo
+
+    def generate_combo_ids(self, num_combos, combo_length, rng=random):
+        """Generate num_combos combos as arrays of technique IDs"""
+        # Same walk as generate_positions with the alias lookups inlined, this is the bulk path
+        ids = self.ids
+        count = len(self.names)
+        tables = [(row.prob, row.alias) for row in self.rows]
+        start = self.start.draw_many(num_combos, rng)
+        uniform = rng.random
+        combos = []
+        for position in start:
+            combo = array(ID_TYPECODE, [ids[position]])
+            for _ in range(combo_length - 1):
+                prob, alias = tables[position]
+                u = uniform() * count
+                i = int(u)
+                position = i if u - i < prob[i] else alias[i]
+                combo.append(ids[position])
+            combos.append(combo)
+        return combos
+
+
+@lru_cache(maxsize=None)
+def _engine(key, mode):
+    return MarkovComboEngine(get_sampler(*key, mode))
+
+
+def get_markov_engine(difficulty, choice, mode="category"):
+    """Return the transition tables of a difficulty/drill choice (built once, on first use)"""
+    return _engine(drill_key(difficulty, choice), mode)
+
+
+@timed("generate.flow_combo_ids")
+def generate_flow_combo_ids(num_combos, combo_length, difficulty, choice, mode="category", rng=random):
+    """Generate combos that follow realistic technique-to-technique flow"""
+    incr("generate.combos", num_combos)
+    return get_markov_engine(difficulty, choice, mode).generate_combo_ids(num_combos, combo_length, rng)
@@ -0,0 +1,117 @@
+# File: combo_registry.py
+import random
+from techniques_data import adv_punches, adv_kicks, adv_elbows, adv_knee, beg_punches, beg_kicks, beg_knee, beg_elbows, \
+    fake_outs, technique_ids
+
+# Sampling modes: "category" picks a category uniformly and then a technique inside it (the original behaviour),
+# "technique" gives every technique of the drill the same chance.
+SAMPLING_MODES = ("category", "technique")
+
+# Technique categories for every (difficulty, drill choice). Choice 3 (kicks and knees) is also the fallback.
+DRILL_CATEGORIES = {
+    ("beg", 1): (beg_punches, beg_kicks, beg_elbows, beg_knee),
+    ("beg", 2): (beg_punches, beg_elbows),
+    ("beg", 3): (beg_kicks, beg_knee),
+    ("beg", 4): (beg_punches, beg_kicks),
+    ("beg", 5): (beg_knee, beg_elbows),
+    ("adv", 1): (adv_punches, adv_kicks, adv_elbows, adv_knee, fake_outs),
+    ("adv", 2): (adv_punches, adv_elbows),
+    ("adv", 3): (adv_kicks, adv_knee),
+    ("adv", 4): (adv_punches, adv_kicks),
+    ("adv", 5): (adv_knee, adv_elbows),
+    ("adv", 6): (fake_outs,),
+}
+
+
+class AliasSampler:
+    """Constant-time weighted sampler over a fixed list of techniques (Walker's alias method)"""
+
+    def __init__(self, names, weights):
+        total = sum(weights)
+        count = len(weights)
+        self.names = tuple(names)
+        self.ids = tuple(technique_ids[name] for name in self.names)
+        self.probabilities = tuple(weight / total for weight in weights)
+        self.prob = [0.0] * count
+        self.alias = list(range(count))
+
+        scaled = [p * count for p in self.probabilities]
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def __len__(self):
+        return len(self.names)
+
+    def draw(self, rng=random):
+        """Return the index of one technique"""
+        u = rng.random() * len(self.prob)
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+    def draw_many(self, k, rng=random):
+        """Return the indexes of k techniques"""
+        count = len(self.prob)
+        prob = self.prob
+        alias = self.alias
+        draws = []
+        for u in [rng.random() * count for _ in range(k)]:
+            i = int(u)
+            draws.append(i if u - i < prob[i] else alias[i])
+        return draws
+
+    def distribution(self):
+        """Return {technique: probability} for this sampler"""
+        return dict(zip(self.names, self.probabilities))
+
+
+def _build_sampler(categories, mode):
+    names = []
+    weights = []
+    positions = {}
+    for category in categories:
+        for technique in category:
+            if technique not in positions:
+                positions[technique] = len(names)
+                names.append(technique)
+                weights.append(0.0)
+            if mode == "category":
+                weights[positions[technique]] += 1 / (len(categories) * len(category))
+    if mode == "technique":
+        weights = [1.0] * len(names)
+    return AliasSampler(names, weights)
+
+
+_registry = {(key, mode): _build_sampler(categories, mode)
+             for key, categories in DRILL_CATEGORIES.items() for mode in SAMPLING_MODES}
+
+
+def drill_key(difficulty, choice):
+    """Normalise a difficulty/choice pair the same way the menus interpret it"""
+    difficulty = "beg" if difficulty.lower() == "beg" else "adv"
+    if (difficulty, choice) not in DRILL_CATEGORIES:
+        choice = 3
+    return difficulty, choice
+
+
+def get_sampler(difficulty, choice, mode="category"):
+    """Return the precompiled sampler for a difficulty/drill choice"""
+    if mode not in SAMPLING_MODES:
+        raise ValueError(f"Unknown sampling mode: {mode}")
+    return _registry[(drill_key(difficulty, choice), mode)]
+
+
+def get_categories(difficulty, choice):
+    """Return the technique categories for a difficulty/drill choice"""
+    return DRILL_CATEGORIES[drill_key(difficulty, choice)]
@@ -0,0 +1,71 @@
+# File: combo_renderer.py
+import os
+import sys
+from colorama import Fore, Style
+from instrumentation import timed
+from techniques_data import technique_table
+
+COMBO_COLORS = [Fore.YELLOW, Fore.GREEN, Fore.CYAN, Fore.MAGENTA, Fore.BLUE, Fore.WHITE]
+
+
+class ComboRenderer:
+    """Renders combos to text, caching every pre-colored technique token
+
+    Colors are used only when the output is a terminal (and NO_COLOR isn't set), otherwise
+    plain text is produced without touching any ANSI codes.
+    """
+
+    def __init__(self, out=None, color=None):
+        self.out = out or sys.stdout
+        if color is None:
+            color = "NO_COLOR" not in os.environ and hasattr(self.out, "isatty") and self.out.isatty()
+        self.color = color
+        self._tokens = {}
+        if color:
+            self.arrow = Fore.WHITE + Style.BRIGHT + " → " + Style.RESET_ALL
+            self._label = Fore.RED + Style.BRIGHT + "{} {}: " + Style.RESET_ALL
+            self._title = Fore.GREEN + Style.BRIGHT + "{}" + Style.RESET_ALL
+        else:
+            self.arrow = " → "
+            self._label = "{} {}: "
+            self._title = "{}"
+
+    def token(self, technique, position):
+        """Technique (name or ID) as it is shown at a position of a combo"""
+        key = (technique, position % len(COMBO_COLORS))
+        token = self._tokens.get(key)
+        if token is None:
+            name = technique_table[technique] if isinstance(technique, int) else technique
+            token = COMBO_COLORS[key[1]] + name + Style.RESET_ALL if self.color else name
+            self._tokens[key] = token
+        return token
+
+    def render_combo(self, combo, combo_number, label="Combo"):
+        token = self.token
+        return self._label.format(label, combo_number) + self.arrow.join(
+            [token(technique, i) for i, technique in enumerate(combo)]) + "\n"
+
+    @timed("render.session")
+    def render_session(self, combinations, title=None, label="Combo", start=1):
+        """Render a whole list of combos (plus an optional title line) into one string"""
+        parts = [self._title.format(title) + "\n"] if title is not None else []
+        render_combo = self.render_combo
+        parts.extend(render_combo(combo, combo_number, label) for combo_number, combo in enumerate(combinations, start))
+        return "".join(parts)
+
+    @timed("render.write_session")
+    def write_session(self, combinations, title=None, label="Combo", start=1):
+        """Render a session into a single buffer and write it in one call"""
+        self.out.write(self.render_session(combinations, title, label, start))
+        self.out.flush()
+
+
+_renderer = None
+
+
+def get_renderer():
+    """Shared renderer for the current stdout"""
+    global _renderer
+    if _renderer is None or _renderer.out is not sys.stdout:
+        _renderer = ComboRenderer(sys.stdout)
+    return _renderer
@@ -0,0 +1,254 @@
+# File: combo_server.py
+"""Small asyncio HTTP/JSON service so one warm process can serve combos to every screen in the gym
+
+Endpoints (all GET, /custom also takes a JSON POST body):
+    /generate?count=5&length=4&difficulty=adv&choice=1&mode=category&flow=1
+    /custom?template=jab > cross > random:kicks&count=3    (or a JSON body with a list of items)
+    /files                       save files from the manifest, newest first
+    /files/<filename>?start=1&limit=50
+    /search?q=uppercutt&limit=10
+    /health
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+from urllib.parse import urlsplit, parse_qs, unquote
+
+MAX_COMBOS_PER_REQUEST = 10000
+MAX_COMBO_LENGTH = 64
+MAX_BODY_BYTES = 64 * 1024
+KEEP_ALIVE_TIMEOUT = 15
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+           500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _int_param(params, name, default, low, high):
+    # Values from a JSON body can be of any type, only whole numbers (or their text) are taken
+    value = params.get(name, [default])[0]
+    try:
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            raise ValueError
+        value = int(value)
+    except ValueError:
+        raise HTTPError(400, f"{name} must be a number") from None
+    if not low <= value <= high:
+        raise HTTPError(400, f"{name} must be between {low} and {high}")
+    return value
+
+
+def _text_param(params, name, default=None):
+    value = params.get(name, [default])[0]
+    if value is not None and not isinstance(value, str):
+        raise HTTPError(400, f"{name} must be a string")
+    return value
+
+
+class ComboService:
+    """Request handlers; each returns a JSON-serialisable object"""
+
+    def __init__(self, directory="."):
+        self.directory = os.path.abspath(directory)
+
+    def warm_up(self):
+        """Import the generators and build the search index before the first request arrives"""
+        import random_combo_generator, combo_markov, combo_templates
+        from techniques_browser import get_search_index
+        get_search_index()
+
+    def generate(self, params):
+        from techniques_data import decode_combo
+        count = _int_param(params, "count", 1, 1, MAX_COMBOS_PER_REQUEST)
+        length = _int_param(params, "length", 4, 1, MAX_COMBO_LENGTH)
+        difficulty = _text_param(params, "difficulty", "beg")
+        if difficulty not in ("beg", "adv"):
+            raise HTTPError(400, "difficulty must be beg or adv")
+        choice = _int_param(params, "choice", 1, 1, 6)
+        mode = _text_param(params, "mode", "category")
+        if mode not in ("category", "technique"):
+            raise HTTPError(400, "mode must be category or technique")
+        if _text_param(params, "flow", "0") not in ("0", "false", ""):
+            from combo_markov import generate_flow_combo_ids
+            combinations = generate_flow_combo_ids(count, length, difficulty, choice, mode)
+        else:
+            from random_combo_generator import generate_combo_ids
+            combinations = generate_combo_ids(count, length, difficulty, choice, mode)
+        return {"combinations": [decode_combo(combo) for combo in combinations]}
+
+    def custom(self, params):
+        from combo_templates import compile_template, parse_template
+        from techniques_data import decode_combo
+        template = params.get("template", [""])[0]
+        if not (isinstance(template, str)
+                or isinstance(template, list) and all(isinstance(item, str) for item in template)):
+            raise HTTPError(400, "template must be a string or a list of techniques")
+        try:
+            compiled = compile_template(template) if isinstance(template, list) else parse_template(template)
+        except (TypeError, ValueError) as e:
+            raise HTTPError(400, str(e)) from None
+        count = _int_param(params, "count", 1, 1, MAX_COMBOS_PER_REQUEST)
+        return {"combinations": [decode_combo(combo) for combo in compiled.reroll(count)]}
+
+    def files(self, params):
+        from combo_manager import get_savefile_index
+        return {"files": get_savefile_index(self.directory)}
+
+    def load_file(self, file_name, params):
+        from combo_manager import SAVE_FORMATS, load_combo_file
+        from techniques_data import decode_combo
+        # Only save files directly in the save directory can be read, checked on the resolved path so
+        # "..", absolute paths and symlinks can't reach anything else
+        path = os.path.realpath(os.path.join(self.directory, file_name.replace("\0", "")))
+        if os.path.dirname(path) != os.path.realpath(self.directory) or not os.path.isfile(path) \
+                or os.path.splitext(path)[1] not in SAVE_FORMATS.values():
+            raise HTTPError(404, "No such save file")
+        combo_data, message = load_combo_file(path)
+        if combo_data is None:
+            raise HTTPError(400, message)
+        combinations = combo_data['combinations']
+        start = _int_param(params, "start", 1, 1, max(1, len(combinations)))
+        limit = _int_param(params, "limit", 50, 1, MAX_COMBOS_PER_REQUEST)
+        return {"name": combo_data['name'], "created": combo_data.get('created'), "total_combos": len(combinations),
+                "start": start, "combinations": [decode_combo(combo) for combo in combinations[start - 1:start - 1 + limit]]}
+
+    def search(self, params):
+        from techniques_browser import search_techniques_ranked
+        limit = _int_param(params, "limit", 20, 1, 1000)
+        return {"results": [{"name": name, "score": score}
+                            for name, score in search_techniques_ranked(_text_param(params, "q", ""), limit)]}
+
+    async def dispatch(self, method, path, params):
+        if method not in ("GET", "POST"):
+            raise HTTPError(405, "Only GET and POST are supported")
+        loop = asyncio.get_running_loop()
+        if path == "/health":
+            return {"status": "ok"}
+        # Generating up to MAX_COMBOS_PER_REQUEST combos or reading a big library takes a while, so
+        # handlers run in the default thread pool and never hold up the other connections
+        if path == "/generate":
+            return await loop.run_in_executor(None, self.generate, params)
+        if path == "/custom":
+            return await loop.run_in_executor(None, self.custom, params)
+        if path == "/search":
+            return await loop.run_in_executor(None, self.search, params)
+        if path == "/files":
+            return await loop.run_in_executor(None, self.files, params)
+        if path.startswith("/files/"):
+            return await loop.run_in_executor(None, self.load_file, unquote(path[len("/files/"):]), params)
+        raise HTTPError(404, "Unknown endpoint")
+
+
+async def _read_request(reader):
+    """Return (method, target, headers, body) or None when the client closed the connection"""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "Malformed request line") from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", 0) or 0)
+    except ValueError:
+        raise HTTPError(400, "Invalid Content-Length") from None
+    if length < 0:
+        raise HTTPError(400, "Invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method, target, version, headers, body
+
+
+def _response(status, payload, keep_alive, elapsed_ms):
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            f"Server-Timing: app;dur={elapsed_ms:.3f}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+class ComboServer:
+    def __init__(self, service, log=None):
+        self.service = service
+        self.log = log if log is not None else sys.stderr
+        self.requests_served = 0
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except HTTPError as e:
+                    writer.write(_response(e.status, {"error": str(e)}, False, 0.0))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, target, version, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                started = time.perf_counter()
+                status, payload = await self._handle(method, target, body)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                writer.write(_response(status, payload, keep_alive, elapsed_ms))
+                await writer.drain()
+                self.requests_served += 1
+                if self.log:
+                    print(f"{method} {target} {status} {elapsed_ms:.2f}ms", file=self.log)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def _handle(self, method, target, body):
+        url = urlsplit(target)
+        params = parse_qs(url.query)
+        try:
+            if method == "POST" and body:
+                try:
+                    posted = json.loads(body)
+                except ValueError:
+                    raise HTTPError(400, "Body must be JSON") from None
+                if not isinstance(posted, dict):
+                    raise HTTPError(400, "Body must be a JSON object")
+                params.update({key: [value] for key, value in posted.items()})
+            return 200, await self.service.dispatch(method, url.path, params)
+        except HTTPError as e:
+            return e.status, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+
+
+async def serve(host="127.0.0.1", port=8080, directory=".", log=None):
+    service = ComboService(directory)
+    service.warm_up()
+    server = ComboServer(service, log)
+    listener = await asyncio.start_server(server.handle_connection, host, port)
+    addresses = ", ".join(str(sock.getsockname()) for sock in listener.sockets)
+    print(f"Serving combos on {addresses}", file=sys.stderr)
+    async with listener:
+        await listener.serve_forever()
+
+
+def run(host="127.0.0.1", port=8080, directory="."):
+    try:
+        asyncio.run(serve(host, port, directory))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,100 @@
+# File: combo_space.py
+import random
+import sys
+from array import array
+from combo_registry import get_sampler
+from techniques_data import ID_TYPECODE, technique_kinds, resolve_kind
+
+
+class ComboSpace:
+    """Every combo of a drill and length that meets kind constraints, counted exactly by dynamic programming
+
+    require:    kinds that must appear at least once (e.g. ["kicks"])
+    start_with: kind of the first technique, end_with: kind of the last one
+
+    ways[p][mask] is how many ways positions p.. can be filled when the required kinds in mask are already
+    used. The same table ranks/unranks combos, so uniform samples take O(length) with no rejection.
+    """
+
+    def __init__(self, difficulty, choice, combo_length, require=(), start_with=None, end_with=None):
+        if combo_length < 1:
+            raise ValueError("Combo length must be at least 1")
+        sampler = get_sampler(difficulty, choice)
+        self.combo_length = combo_length
+        self.kinds = {}
+        for technique_id, name in zip(sampler.ids, sampler.names):
+            self.kinds.setdefault(technique_kinds[name], []).append(technique_id)
+        self.require = tuple(dict.fromkeys(resolve_kind(kind) for kind in require))
+        self.start_with = resolve_kind(start_with) if start_with else None
+        self.end_with = resolve_kind(end_with) if end_with else None
+
+        full = (1 << len(self.require)) - 1
+        bits = {kind: (1 << self.require.index(kind)) if kind in self.require else 0 for kind in self.kinds}
+        self._bits = bits
+        ways = [None] * (combo_length + 1)
+        ways[combo_length] = [1 if mask == full else 0 for mask in range(full + 1)]
+        for position in range(combo_length - 1, -1, -1):
+            following = ways[position + 1]
+            ways[position] = [sum(len(self.kinds[kind]) * following[mask | bits[kind]]
+                                  for kind in self._allowed_kinds(position)) for mask in range(full + 1)]
+        self._ways = ways
+        self.count = ways[0][0]
+
+    def _allowed_kinds(self, position):
+        if position == 0 and self.start_with:
+            return [self.start_with] if self.start_with in self.kinds else []
+        if position == self.combo_length - 1 and self.end_with:
+            return [self.end_with] if self.end_with in self.kinds else []
+        return list(self.kinds)
+
+    def __len__(self):
+        return self.count
+
+    def unrank(self, rank):
+        """The rank-th valid combo (0 <= rank < count) as an array of technique IDs"""
+        if not 0 <= rank < self.count:
+            raise IndexError("rank out of range")
+        combo = array(ID_TYPECODE)
+        mask = 0
+        for position in range(self.combo_length):
+            following = self._ways[position + 1]
+            for kind in self._allowed_kinds(position):
+                techniques = self.kinds[kind]
+                next_mask = mask | self._bits[kind]
+                block = following[next_mask]
+                if rank < len(techniques) * block:
+                    index, rank = divmod(rank, block)
+                    combo.append(techniques[index])
+                    mask = next_mask
+                    break
+                rank -= len(techniques) * block
+        return combo
+
+    def sample(self, rng=random):
+        """One uniformly random valid combo"""
+        if not self.count:
+            raise ValueError("No combo meets these constraints")
+        return self.unrank(rng.randrange(self.count))
+
+    def sample_many(self, num_combos, rng=random, unique=False):
+        """num_combos uniformly random valid combos, all different when unique is set"""
+        if not unique:
+            return [self.sample(rng) for _ in range(num_combos)]
+        if num_combos > self.count:
+            raise ValueError(f"Only {self.count} different combos meet these constraints, {num_combos} were requested")
+        if self.count <= sys.maxsize:
+            return [self.unrank(rank) for rank in rng.sample(range(self.count), num_combos)]
+        # The list keeps the order ranks were drawn in, the set only finds repeats
+        ranks = []
+        seen = set()
+        while len(ranks) < num_combos:
+            rank = rng.randrange(self.count)
+            if rank not in seen:
+                seen.add(rank)
+                ranks.append(rank)
+        return [self.unrank(rank) for rank in ranks]
+
+
+def count_combos(difficulty, choice, combo_length, require=(), start_with=None, end_with=None):
+    """Exact number of different combos for the settings and constraints"""
+    return ComboSpace(difficulty, choice, combo_length, require, start_with, end_with).count
@@ -0,0 +1,61 @@
+# File: combo_stream.py
+import json
+import sys
+from itertools import count as count_from
+from random_combo_generator import generate_combo_ids
+from techniques_data import decode_combo
+
+# Limits for streamed output; count=None means "keep going until the reader stops"
+MAX_COMBO_LENGTH = 64
+MAX_COMBOS = None
+BATCH_SIZE = 1024
+
+
+def stream_combinations(num_combos=None, combo_length=4, difficulty="adv", choice=1, mode="category",
+                        batch_size=BATCH_SIZE, max_length=MAX_COMBO_LENGTH, max_combos=MAX_COMBOS):
+    """Yield combinations (technique ID arrays) lazily, one batch in memory at a time"""
+    if not 1 <= combo_length <= max_length:
+        raise ValueError(f"Combo length must be between 1 and {max_length}")
+    if num_combos is not None and num_combos < 0:
+        raise ValueError("Number of combos can't be negative")
+    if max_combos is not None and (num_combos is None or num_combos > max_combos):
+        raise ValueError(f"Max {max_combos} combos per stream")
+
+    remaining = num_combos
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        yield from generate_combo_ids(size, combo_length, difficulty, choice, mode)
+        if remaining is not None:
+            remaining -= size
+
+
+def combo_record(combo, combo_number):
+    """Return one combination as an NDJSON line"""
+    return json.dumps({"combo": combo_number, "techniques": decode_combo(combo)}, separators=(",", ":")) + "\n"
+
+
+def write_ndjson(combos, out=None, batch_size=BATCH_SIZE):
+    """Write combinations as NDJSON to out (stdout by default) and return how many were written"""
+    out = out or sys.stdout
+    lines = []
+    written = 0
+    for combo_number, combo in zip(count_from(1), combos):
+        lines.append(combo_record(combo, combo_number))
+        written = combo_number
+        if len(lines) >= batch_size:
+            out.write("".join(lines))
+            lines.clear()
+    if lines:
+        out.write("".join(lines))
+    out.flush()
+    return written
+
+
+def stream_to_file(file_name, num_combos, combo_length, difficulty, choice, mode="category"):
+    """Stream generated combinations straight into an NDJSON file"""
+    try:
+        with open(file_name, "w") as ndjson_file:
+            written = write_ndjson(stream_combinations(num_combos, combo_length, difficulty, choice, mode), ndjson_file)
+        return True, f"{written} combinations written to {file_name}"
+    except (OSError, ValueError) as e:
+        return False, f"Error writing file: {str(e)}"
@@ -0,0 +1,181 @@
+# File: combo_templates.py
+"""Custom combo templates, compiled once and re-rolled in bulk
+
+Template syntax: steps separated by ">" (the old comma separated lists work too), e.g.
+    jab > cross > random:kicks > {knee|elbow} x2
+A step is a technique name (any case), random:<kind> / random_<kind> / a bare kind word (kick, knees, fakes...)
+for a random technique of that kind, or {a|b|...} for any technique of the alternatives.
+"x2" (or "*2") after a step repeats it. Blank lines and lines starting with # are skipped in template files.
+"""
+import difflib
+import random
+import re
+from array import array
+from functools import lru_cache
+from itertools import repeat
+from techniques_data import (ID_TYPECODE, KIND_ALIASES, technique_ids, technique_table, random_category_mapping,
+                             decode_combo, resolve_kind)
+
+MAX_TEMPLATE_LENGTH = 64
+# Problems reported from one template file before giving up on listing them
+MAX_REPORTED_PROBLEMS = 20
+
+_REPEAT = re.compile(r"^(.*?)\s*(?:\bx|\*)\s*(\d+)$", re.IGNORECASE)
+_NAMES = {name.lower(): name for name in technique_table}
+
+
+def _position_ids(item):
+    """Technique IDs one template item can become, or None for an unknown item"""
+    if item in technique_ids:
+        return (technique_ids[item],)
+    if item in random_category_mapping:
+        return tuple(technique_ids[name] for name in random_category_mapping[item])
+    if len(item) > 2 and item[0] == "{" and item[-1] == "}":
+        alternatives = [_position_ids(alternative) for alternative in item[1:-1].split("|")]
+        if None in alternatives:
+            return None
+        return tuple(dict.fromkeys(technique_id for ids in alternatives for technique_id in ids))
+    return None
+
+
+class ComboTemplate:
+    """A custom combo template (technique names and random_* placeholders) compiled once
+
+    Every position becomes the tuple of technique IDs it can resolve to, so resolving is
+    a draw per random position with no name lookups.
+    """
+
+    def __init__(self, items):
+        self.items = tuple(items)
+        positions = [_position_ids(item) for item in self.items]
+        unknown = [item for item, ids in zip(self.items, positions) if ids is None]
+        if not self.items or unknown:
+            raise ValueError(f"Unknown techniques in template: {', '.join(unknown) or '(empty template)'}")
+        self.positions = tuple(positions)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __repr__(self):
+        return f"ComboTemplate({list(self.items)!r})"
+
+    def variants(self):
+        """How many different combos the template can produce"""
+        count = 1
+        for choices in self.positions:
+            count *= len(choices)
+        return count
+
+    def resolve(self, rng=random):
+        """One combo (array of technique IDs); draws like resolve_custom_combo, so seeds give the same combos"""
+        return array(ID_TYPECODE, [choices[0] if len(choices) == 1 else rng.choice(choices)
+                                   for choices in self.positions])
+
+    def reroll(self, num_combos, rng=random):
+        """num_combos combos at once, built a position (column) at a time"""
+        uniform = rng.random
+        columns = []
+        for choices in self.positions:
+            if len(choices) == 1:
+                columns.append(repeat(choices[0], num_combos))
+            else:
+                count = len(choices)
+                columns.append([choices[int(uniform() * count)] for _ in range(num_combos)])
+        return [array(ID_TYPECODE, combo) for combo in zip(*columns)]
+
+    def resolve_names(self, rng=random):
+        return decode_combo(self.resolve(rng))
+
+
+@lru_cache(maxsize=256)
+def _compile(items):
+    return ComboTemplate(items)
+
+
+def compile_template(items):
+    """Compiled template for a list of technique names/random_* placeholders (cached); raises ValueError"""
+    return _compile(tuple(items))
+
+
+def _normalise_step(word):
+    """Template item for one written step (technique name, random_* category or kind word)"""
+    key = " ".join(word.lower().split())
+    if key in _NAMES:
+        return _NAMES[key]
+    if key in random_category_mapping:
+        return key
+    for prefix in ("random:", "random "):
+        if key.startswith(prefix):
+            key = key[len(prefix):].strip()
+    if key in KIND_ALIASES:
+        return "random_" + resolve_kind(key)
+    close = difflib.get_close_matches(key, list(_NAMES) + list(KIND_ALIASES), n=1)
+    hint = f" (did you mean {close[0]!r}?)" if close else ""
+    raise ValueError(f"Unknown technique {word.strip()!r}{hint}")
+
+
+def _parse_step(step):
+    """Template items of one step, e.g. "{knee|elbow} x2" -> ["{random_knees|random_elbows}"] * 2"""
+    times = 1
+    match = _REPEAT.match(step)
+    if match:
+        step, times = match.group(1).strip(), int(match.group(2))
+        if not 1 <= times <= MAX_TEMPLATE_LENGTH:
+            raise ValueError(f"Repeat counts must be between 1 and {MAX_TEMPLATE_LENGTH}")
+    if step.startswith("{") and step.endswith("}"):
+        alternatives = list(dict.fromkeys(_normalise_step(alternative) for alternative in step[1:-1].split("|")))
+        item = alternatives[0] if len(alternatives) == 1 else "{" + "|".join(alternatives) + "}"
+    else:
+        item = _normalise_step(step)
+    return [item] * times
+
+
+@lru_cache(maxsize=1024)
+def parse_template(source):
+    """Compile template text (see the module docstring) to a ComboTemplate; cached by source, raises ValueError"""
+    if ">" in source:
+        steps = source.split(">")
+    else:
+        # Old comma separated form; a few technique names contain commas, so a piece that isn't a
+        # step on its own is joined with the next one
+        steps = []
+        pending = None
+        for piece in source.split(","):
+            pending = piece if pending is None else pending + "," + piece
+            try:
+                _parse_step(pending.strip())
+            except ValueError:
+                continue
+            steps.append(pending)
+            pending = None
+        if pending is not None:
+            # Something is wrong in there; split plainly so the error points at the right step
+            steps = source.split(",")
+
+    items = []
+    for number, step in enumerate(steps, 1):
+        step = step.strip()
+        if not step:
+            raise ValueError(f"Step {number} is empty")
+        try:
+            items.extend(_parse_step(step))
+        except ValueError as e:
+            raise ValueError(f"Step {number}: {e}") from None
+    if len(items) > MAX_TEMPLATE_LENGTH:
+        raise ValueError(f"Templates can have at most {MAX_TEMPLATE_LENGTH} techniques")
+    return compile_template(items)
+
+
+def parse_template_lines(lines):
+    """Validate and compile every template of a template file in one pass; returns (templates, problems)"""
+    templates = []
+    problems = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            templates.append(parse_template(line))
+        except ValueError as e:
+            problems.append(f"Line {line_number}: {e}")
+    return templates, problems
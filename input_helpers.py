@@ -1,7 +1,21 @@
 #File name input_helpers.py
-from colorama import init, Fore, Style
-init()
+from colorama import Fore, Style
+from instrumentation import timed
 
+_colors_initialised = False
+
+
+def init_colors():
+    """Set up colorama once, the first time colored output is actually needed"""
+    global _colors_initialised
+    if not _colors_initialised:
+        from colorama import init
+        init()
+        _colors_initialised = True
+
+
+# Mostly the time the user takes to answer, kept apart so it isn't mistaken for slow code
+@timed("input.get_valid_input")
 def get_valid_input(prompt, min_value, max_value, too_low_msg=None, too_high_msg=None, invalid_msg=None):
     while True:
         try:
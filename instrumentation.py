@@ -0,0 +1,125 @@
+# File: instrumentation.py
+"""Opt-in timers and counters around the hot paths, plus a cProfile switch
+
+MTCCG_STATS=1            print the collected stats as JSON to stderr at exit
+MTCCG_STATS=stats.json   write them to that file instead
+MTCCG_PROFILE=run.pstats profile the whole session with cProfile (read with python -m pstats run.pstats)
+
+While stats are off, timed functions aren't wrapped at all and cost nothing. Stats have to be
+enabled before the timed modules are imported (the env var is read when this module is, and the CLI
+enables --stats before a command imports anything), functions decorated earlier stay untimed.
+"""
+import atexit
+import os
+import sys
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+_enabled = False
+_stats_target = None
+_timers = {}
+_counters = {}
+
+
+def enable(target="-"):
+    """Start collecting; the stats are dumped to target (a file name, or "-" for stderr) at exit"""
+    global _enabled, _stats_target
+    if not _enabled:
+        atexit.register(dump_stats)
+    _enabled = True
+    _stats_target = target
+
+
+def is_enabled():
+    return _enabled
+
+
+def timed(name):
+    """Decorator recording call count and time of a function under name; returns the function unchanged
+    when stats aren't enabled at the time it is decorated"""
+    def decorate(func):
+        if not _enabled:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - started)
+        return wrapper
+    return decorate
+
+
+def record(name, seconds):
+    timer = _timers.get(name)
+    if timer is None:
+        timer = _timers[name] = [0, 0.0, 0.0]
+    timer[0] += 1
+    timer[1] += seconds
+    if seconds > timer[2]:
+        timer[2] = seconds
+
+
+def incr(name, amount=1):
+    if _enabled:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def snapshot():
+    """{"timers": {name: {calls, total_ms, mean_ms, max_ms}}, "counters": {name: value}}"""
+    return {
+        "timers": {name: {"calls": calls, "total_ms": round(total * 1000, 3),
+                          "mean_ms": round(total * 1000 / calls, 3), "max_ms": round(longest * 1000, 3)}
+                   for name, (calls, total, longest) in sorted(_timers.items())},
+        "counters": dict(sorted(_counters.items())),
+    }
+
+
+def reset():
+    _timers.clear()
+    _counters.clear()
+
+
+def dump_stats():
+    import json
+    text = json.dumps(snapshot(), indent=2) + "\n"
+    if _stats_target in (None, "-"):
+        sys.stderr.write(text)
+    else:
+        with open(_stats_target, "w") as stats_file:
+            stats_file.write(text)
+
+
+def format_stats(stats):
+    """Stats (as from snapshot or a dump file) as a readable table, slowest total first"""
+    lines = [f"{'timer':<32}{'calls':>8}{'total ms':>12}{'mean ms':>10}{'max ms':>10}"]
+    for name, timer in sorted(stats.get("timers", {}).items(), key=lambda item: -item[1]["total_ms"]):
+        lines.append(f"{name:<32}{timer['calls']:>8}{timer['total_ms']:>12.3f}{timer['mean_ms']:>10.3f}"
+                     f"{timer['max_ms']:>10.3f}")
+    for name, value in stats.get("counters", {}).items():
+        lines.append(f"{name:<32}{value:>8}")
+    return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def profiled(path):
+    """Run the block under cProfile and write the result to path (does nothing when path is empty)"""
+    if not path:
+        yield
+        return
+    import cProfile
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        print(f"Profile written to {path}", file=sys.stderr)
+
+
+if os.environ.get("MTCCG_STATS"):
+    enable("-" if os.environ["MTCCG_STATS"] in ("1", "-") else os.environ["MTCCG_STATS"])
@@ -1,34 +1,48 @@
 # File: mtccg_main_file.py
-from colorama import init, Fore, Style
-from techniques_browser import technique_details
-from technique_customizer import custom_combos
-from input_helpers import get_valid_input
-from random_combo_generator import training_session
-from combo_manager import get_available_savefiles, load_combo_file
+import sys
+from colorama import Fore, Style
+from input_helpers import get_valid_input, init_colors
 
-init()
+# The session modules (generator, customizer, browser, save files) are imported when their menu option is picked
 
 
-def display_loaded_combos(combo_data):
-    """Display loaded combinations in a nice format"""
-    print(Fore.GREEN + Style.BRIGHT + f"\n === LOADED COMBOS: {combo_data['name']} === " + Style.RESET_ALL)
+LOADED_PAGE_SIZE = 50
 
-    combinations = combo_data['combinations']
-    colors = [Fore.YELLOW, Fore.GREEN, Fore.CYAN, Fore.MAGENTA, Fore.BLUE, Fore.WHITE]
 
-    for i, combo in enumerate(combinations):
-        colored_combo = []
-    for j, technique in enumerate(combo):
-        color = colors[j % len(colors)]
-        colored_combo.append(color + technique + Style.RESET_ALL)
+def display_loaded_combos(combo_data):
+    """Display loaded combinations in a nice format, a page at a time for big sets"""
+    from combo_renderer import get_renderer
+    combinations = combo_data['combinations']
+    title = f"\n === LOADED COMBOS: {combo_data['name']} === "
+    if len(combinations) <= LOADED_PAGE_SIZE:
+        get_renderer().write_session(combinations, title)
+        return
 
-    print(Fore.RED + Style.BRIGHT + f"Combo {i + 1}: " + Style.RESET_ALL + (
-    Fore.WHITE + Style.BRIGHT + " → " + Style.RESET_ALL).join(colored_combo))
+    # Only the combos of the current page are read, so archives of any size can be browsed
+    start = 1
+    while True:
+        get_renderer().write_session(combinations[start - 1:start - 1 + LOADED_PAGE_SIZE], title, start=start)
+        title = None
+        user_choice = input(Fore.CYAN + f"Combos {start}-{min(start + LOADED_PAGE_SIZE - 1, len(combinations))} of {len(combinations)}. "
+                            "n - Next page, p - Previous page, combo number to jump, q - Quit: " + Style.RESET_ALL).lower()
+        if user_choice == "n" and start + LOADED_PAGE_SIZE <= len(combinations):
+            start += LOADED_PAGE_SIZE
+        elif user_choice == "p" and start > 1:
+            start = max(1, start - LOADED_PAGE_SIZE)
+        elif user_choice.isdigit() and 1 <= int(user_choice) <= len(combinations):
+            start = int(user_choice)
+        elif user_choice in ['q', 'quit']:
+            return
+        else:
+            print(Fore.YELLOW + "Nothing there! Try another option." + Style.RESET_ALL)
 
 
 def load_saved_combos():
     """Handle the loading of saved combo files"""
-    available_files = get_available_savefiles()
+    from combo_manager import get_savefile_index, load_combo_file
+
+    # Listing comes from the save-file manifest, files are only parsed when picked
+    available_files = get_savefile_index()
 
     if not available_files:
         print(Fore.YELLOW + " No saved combo files found in the current directory." + Style.RESET_ALL)
@@ -36,10 +50,12 @@ def load_saved_combos():
         return
 
     print(Fore.CYAN + Style.BRIGHT + "\n AVAILABLE SAVED COMBOS:" + Style.RESET_ALL)
-    for i, filename in enumerate(available_files, 1):
-        print(Fore.WHITE + Style.BRIGHT + f"{i}." + Style.RESET_ALL + Fore.YELLOW + f" {filename}" + Style.RESET_ALL)
-
-        print(
+    lines = []
+    for i, entry in enumerate(available_files, 1):
+        lines.append(Fore.WHITE + Style.BRIGHT + f"{i}." + Style.RESET_ALL + Fore.YELLOW + f" {entry['filename']}" + Style.RESET_ALL +
+                     Fore.WHITE + f" - {entry['name']} ({entry['total_combos']} combos, {entry.get('created') or 'unknown date'})" + Style.RESET_ALL)
+    print("\n".join(lines))
+    print(
  Fore.WHITE + Style.BRIGHT + f"{len(available_files) + 1}." + Style.RESET_ALL + Fore.RED + " Back to Main Menu" + Style.RESET_ALL)
 
     choice = get_valid_input(
@@ -51,7 +67,7 @@ Fore.CYAN + "Select a file to load: " + Style.RESET_ALL,
     if choice == len(available_files) + 1:
         return
 
-    selected_file = available_files[choice - 1]
+    selected_file = available_files[choice - 1]['filename']
     combo_data, message = load_combo_file(selected_file)
 
     if combo_data:
@@ -83,6 +99,7 @@ Fore.CYAN + "Select a file to load: " + Style.RESET_ALL,
 
 
 def main():
+    init_colors()
     print(Fore.CYAN + Style.BRIGHT + """
 ===WELCOME TO MUAY THAI RANDOM COMBO GENERATOR===""" + Style.RESET_ALL)
 
@@ -123,6 +140,7 @@ def main():
 
         elif difficulty.lower() == "cust":
             print(Fore.BLUE + Style.BRIGHT + "✓ Custom mode selected!" + Style.RESET_ALL)
+            from technique_customizer import custom_combos
             custom_combos()
             return
 
@@ -159,10 +177,12 @@ What drills would you like to work on?""" + Style.RESET_ALL)
  Fore.YELLOW + Style.BRIGHT + " I'm sorry but this is too advanced for your difficulty. Fundamentals first!" + Style.RESET_ALL)
 
             else:
+                from random_combo_generator import training_session
                 training_session(difficulty, choice)
                 break
 
         elif choice == 7:
+            from techniques_browser import technique_details
             technique_details()
             break
 
@@ -170,19 +190,29 @@ What drills would you like to work on?""" + Style.RESET_ALL)
             return
 
         else:
+            from random_combo_generator import training_session
             training_session(difficulty, choice)
             break
 
 
 if __name__ == "__main__":
-    while True:
-        result = main()
-        if result == "EXIT":
-            break
+    if len(sys.argv) > 1:
+        # Headless mode: python mtccg_main_file.py generate -n 5 ...
+        from combo_cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+
+    import os
+    from instrumentation import profiled
+    # MTCCG_PROFILE=session.pstats profiles the whole session, MTCCG_STATS=1 dumps hot-path timings at exit
+    with profiled(os.environ.get("MTCCG_PROFILE")):
+        while True:
+            result = main()
+            if result == "EXIT":
+                break
 
-        restart = input(
+            restart = input(
  Fore.MAGENTA + "\nWould you like to return to the main menu? or Exit? " + Style.BRIGHT + "(y/e)" + Style.RESET_ALL + Fore.MAGENTA + ": " + Style.RESET_ALL)
-        if restart.lower() != 'y':
-            print(
+            if restart.lower() != 'y':
+                print(
  Fore.GREEN + Style.BRIGHT + " Thanks for training! Keep practicing those combos! " + Style.RESET_ALL)
-            break
\ No newline at end of file
+                break
\ No newline at end of file
@@ -0,0 +1,156 @@
+# File: round_timer.py
+"""Timed rounds that call out a combo every few seconds
+
+Every event has a fixed offset from the start and is waited for against time.monotonic(), so a
+late callout never pushes back the ones after it (no drift). How late each event actually fired
+(its jitter) is measured and summarised at the end.
+"""
+import json
+import math
+import statistics
+import sys
+import time
+
+# Events: round_start, combo, warning, round_end (the rest starts), done
+WARNING_SECONDS = 10
+
+
+def schedule(rounds=3, round_seconds=180, rest_seconds=60, interval=4.0, warning_seconds=WARNING_SECONDS):
+    """Yield (offset in seconds from the start, event, round number) for a whole session, in order"""
+    if interval <= 0 or round_seconds <= 0:
+        raise ValueError("Round length and interval must be positive")
+    start = 0.0
+    for round_number in range(1, rounds + 1):
+        yield start, "round_start", round_number
+        events = []
+        # Callout i is computed from the round start, never by adding interval up, so float error can't pile
+        # up either; one due exactly at the bell is left out
+        events.extend((start + i * interval, "combo") for i in range(math.ceil(round_seconds / interval))
+                      if i * interval < round_seconds)
+        if 0 < warning_seconds < round_seconds:
+            events.append((start + round_seconds - warning_seconds, "warning"))
+        events.sort(key=lambda event: (event[0], event[1] == "combo"))
+        for offset, event in events:
+            yield offset, event, round_number
+        end = start + round_seconds
+        yield end, "round_end", round_number
+        start = end + (rest_seconds if round_number < rounds else 0)
+    yield start, "done", rounds
+
+
+class RoundTimer:
+    """Runs a schedule in real time, taking a combo from combos for every callout
+
+    Listeners get (event, record) where record has the round, the scheduled and actual time and,
+    for callouts, the combo number and combo.
+    """
+
+    def __init__(self, events, combos, listeners=(), clock=time.monotonic, sleep=time.sleep):
+        self.events = events
+        self.combos = iter(combos)
+        self.listeners = list(listeners)
+        self.clock = clock
+        self.sleep = sleep
+        self.jitter = []
+
+    def wait_until(self, deadline):
+        while True:
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                return
+            self.sleep(remaining)
+
+    def run(self):
+        started = self.clock()
+        combo_number = 0
+        for offset, event, round_number in self.events:
+            # The combo is drawn before waiting, so generating it never makes the callout late
+            combo = next(self.combos) if event == "combo" else None
+            deadline = started + offset
+            self.wait_until(deadline)
+            fired = self.clock()
+            self.jitter.append(fired - deadline)
+            record = {"event": event, "round": round_number, "scheduled": round(offset, 3),
+                      "elapsed": round(fired - started, 4), "jitter_ms": round((fired - deadline) * 1000, 3)}
+            if event == "combo":
+                combo_number += 1
+                record["combo_number"] = combo_number
+                record["combo"] = combo
+            for listener in self.listeners:
+                listener(event, record)
+        return self.jitter_summary()
+
+    def jitter_summary(self):
+        """Callout lateness in milliseconds: mean, p95 and max"""
+        if not self.jitter:
+            return {"events": 0}
+        late = sorted(seconds * 1000 for seconds in self.jitter)
+        return {"events": len(late), "mean_ms": round(statistics.fmean(late), 3),
+                "p95_ms": round(late[min(len(late) - 1, int(len(late) * 0.95))], 3), "max_ms": round(late[-1], 3)}
+
+
+class TerminalDisplay:
+    """Shows the round clock and the called out combos in the terminal"""
+
+    def __init__(self, rounds, round_seconds, rest_seconds, renderer=None):
+        from combo_renderer import get_renderer
+        self.rounds = rounds
+        self.round_seconds = round_seconds
+        self.rest_seconds = rest_seconds
+        self.renderer = renderer or get_renderer()
+        self.round_started = 0.0
+
+    def paint(self, text, *codes):
+        """text in the given colorama codes, when the renderer uses colors"""
+        if not self.renderer.color:
+            return text
+        from colorama import Style
+        return "".join(codes) + text + Style.RESET_ALL
+
+    def __call__(self, event, record):
+        from colorama import Fore, Style
+        out = self.renderer.out
+        if event == "round_start":
+            self.round_started = record["scheduled"]
+            out.write(self.paint(f"\n🥊 ROUND {record['round']} - FIGHT!", Fore.GREEN, Style.BRIGHT) + "\n")
+        elif event == "combo":
+            left = int(self.round_seconds - (record["scheduled"] - self.round_started))
+            out.write(self.paint(f"[{left // 60}:{left % 60:02d}] ", Fore.WHITE))
+            out.write(self.renderer.render_combo(record["combo"], record["combo_number"]))
+        elif event == "warning":
+            out.write(self.paint(f"⏱  {WARNING_SECONDS} seconds left!", Fore.YELLOW, Style.BRIGHT) + "\n")
+        elif event == "round_end":
+            rest = f" Rest {self.rest_seconds:g}s." if record["round"] < self.rounds and self.rest_seconds else ""
+            out.write(self.paint(f"🔔 End of round {record['round']}.{rest}", Fore.RED, Style.BRIGHT) + "\n")
+        elif event == "done":
+            out.write(self.paint("Session done. Good work!", Fore.GREEN, Style.BRIGHT) + "\n")
+        out.flush()
+
+
+class EventStream:
+    """Writes every event as one NDJSON line (for external displays), flushed right away"""
+
+    def __init__(self, out):
+        self.out = out
+
+    def __call__(self, event, record):
+        if "combo" in record:
+            from techniques_data import decode_combo
+            record = dict(record, combo=decode_combo(record["combo"]))
+        self.out.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.out.flush()
+
+
+def run_rounds(combos, rounds=3, round_seconds=180, rest_seconds=60, interval=4.0, display=True, events_out=None):
+    """Run a timed session and return the jitter summary (also after Ctrl+C or when the event reader goes away)"""
+    listeners = []
+    if display:
+        listeners.append(TerminalDisplay(rounds, round_seconds, rest_seconds))
+    if events_out is not None:
+        listeners.append(EventStream(events_out))
+    timer = RoundTimer(schedule(rounds, round_seconds, rest_seconds, interval), combos, listeners)
+    try:
+        return timer.run()
+    except (KeyboardInterrupt, BrokenPipeError):
+        print("\nTimer stopped.", file=sys.stderr)
+        return timer.jitter_summary()
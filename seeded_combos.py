@@ -0,0 +1,158 @@
+# File: seeded_combos.py
+import hashlib
+import json
+import random
+from collections.abc import Sequence
+from bulk_generation import derive_seed, new_seed
+from techniques_data import technique_table
+
+# Combos drawn per seeded block. Saves from before blocks existed have no "block_size" and
+# used one seed per combo, which is the same as blocks of 1
+BLOCK_SIZE = 1024
+# Sequences up to this many combos keep every block once it is drawn, longer ones only the last
+MAX_CACHED_COMBOS = 1000000
+# Saves record how their fingerprint was taken; saves without "fingerprint_version" are version 1, which
+# only covered the random_* categories of custom templates
+FINGERPRINT_VERSION = 2
+
+
+class DataChanged(ValueError):
+    """The technique lists changed since a seeded save, so its combos can't be regenerated"""
+
+
+def _fingerprint(data):
+    return hashlib.sha256(json.dumps(data, separators=(",", ":")).encode()).hexdigest()[:16]
+
+
+def data_fingerprint(params, version=FINGERPRINT_VERSION):
+    """Hash of the technique data the combos of params are drawn from"""
+    if params["generator"] == "custom" and version == 1:
+        from combo_templates import compile_template
+        from techniques_data import random_category_mapping
+        for template in params["templates"]:
+            # Still raises for items that no longer exist
+            compile_template(template)
+        used = sorted({item for template in params["templates"] for item in template
+                       if item in random_category_mapping})
+        return _fingerprint([[category, random_category_mapping[category]] for category in used])
+    if params["generator"] == "custom":
+        # Every position of every template, as the techniques it resolves to now (random_* categories,
+        # {a|b} alternatives and plain names alike)
+        from combo_templates import compile_template
+        return _fingerprint([[[technique_table[technique_id] for technique_id in choices]
+                              for choices in compile_template(template).positions]
+                             for template in params["templates"]])
+    from combo_registry import get_sampler
+    sampler = get_sampler(params["difficulty"], params["choice"], params["mode"])
+    data = [list(sampler.ids), list(sampler.probabilities)]
+    if params["flow"]:
+        from combo_markov import get_markov_engine
+        data.append([list(row.probabilities) for row in
+                     get_markov_engine(params["difficulty"], params["choice"], params["mode"]).rows])
+    return _fingerprint(data)
+
+
+class SeededCombos(Sequence):
+    """Combos regenerated on demand from a seed and the generation settings
+
+    Combos are drawn in blocks of params["block_size"] through the batch generators, block b with its
+    own random.Random(derive_seed(seed, b)), so any combo can be produced without the blocks before it
+    and a save file only needs the seed and settings. Drawn blocks are cached, so iterating again
+    (say rendering, then saving) doesn't draw everything twice.
+    """
+
+    def __init__(self, seed, count, params):
+        self.seed = seed
+        self.count = count
+        self.params = params
+        self.block_size = params.get("block_size", 1)
+        self._blocks = {}
+
+    @classmethod
+    def generate(cls, count, combo_length, difficulty, choice, mode="category", flow=False, seed=None):
+        return cls(new_seed() if seed is None else seed, count,
+                   {"generator": "generate", "combo_length": combo_length, "difficulty": difficulty,
+                    "choice": choice, "mode": mode, "flow": flow, "block_size": BLOCK_SIZE})
+
+    @classmethod
+    def custom(cls, templates, count=None, seed=None):
+        """Custom combos; combo i resolves templates[i % len(templates)]"""
+        templates = [list(template) for template in templates]
+        return cls(new_seed() if seed is None else seed, len(templates) if count is None else count,
+                   {"generator": "custom", "templates": templates, "block_size": BLOCK_SIZE})
+
+    def _draw_block(self, block):
+        start = block * self.block_size
+        size = min(self.block_size, self.count - start)
+        rng = random.Random(derive_seed(self.seed, block))
+        params = self.params
+        if params["generator"] == "custom":
+            from combo_templates import compile_template
+            templates = [compile_template(template) for template in params["templates"]]
+            return [templates[index % len(templates)].resolve(rng) for index in range(start, start + size)]
+        settings = (size, params["combo_length"], params["difficulty"], params["choice"], params["mode"])
+        if params["flow"]:
+            from combo_markov import generate_flow_combo_ids
+            return generate_flow_combo_ids(*settings, rng=rng)
+        from random_combo_generator import generate_combo_ids
+        return generate_combo_ids(*settings, rng=rng)
+
+    def block(self, block):
+        """The combos of one block, drawn on first use"""
+        combos = self._blocks.get(block)
+        if combos is None:
+            combos = self._draw_block(block)
+            if self.count > MAX_CACHED_COMBOS:
+                self._blocks.clear()
+            self._blocks[block] = combos
+        return combos
+
+    def combo(self, index):
+        return self.block(index // self.block_size)[index % self.block_size]
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for block in range(-(-self.count // self.block_size)):
+            yield from self.block(block)
+
+    def stream(self):
+        """Iterate once without keeping the drawn blocks, for sets that are only written out"""
+        for block in range(-(-self.count // self.block_size)):
+            yield from self._blocks.get(block) or self._draw_block(block)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.combo(i) for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("combo index out of range")
+        return self.combo(index)
+
+    @property
+    def total_techniques(self):
+        if self.params["generator"] == "custom":
+            lengths = [len(template) for template in self.params["templates"]]
+            full, rest = divmod(self.count, len(lengths))
+            return full * sum(lengths) + sum(lengths[:rest])
+        return self.count * self.params["combo_length"]
+
+    def to_record(self):
+        """What a save file stores instead of the combos"""
+        return {"seed": self.seed, "total_combos": self.count, "params": self.params,
+                "fingerprint": data_fingerprint(self.params), "fingerprint_version": FINGERPRINT_VERSION}
+
+    @classmethod
+    def from_record(cls, record):
+        """Rebuild from to_record() data; raises DataChanged when the technique data no longer matches"""
+        combos = cls(record["seed"], record["total_combos"], record["params"])
+        try:
+            fingerprint = data_fingerprint(combos.params, record.get("fingerprint_version", 1))
+        except ValueError:
+            # A template item that no longer exists
+            fingerprint = None
+        if fingerprint is None or fingerprint != record.get("fingerprint"):
+            raise DataChanged("The technique lists changed since this file was saved, its combos can't be regenerated")
+        return combos
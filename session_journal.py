@@ -0,0 +1,256 @@
+# File: session_journal.py
+"""Append-only journal of every generated session (training and custom), kept next to the save files
+
+The journal is a folder of NDJSON segments (segment-000001.ndjson, ...), one session per line. New
+sessions are buffered and written + fsynced together once FLUSH_BYTES are waiting or FLUSH_SECONDS
+after the first one, and at exit. A segment is closed once it passes SEGMENT_BYTES and a new one
+started, so old history is never rewritten except by compact_journal.
+
+MTCCG_JOURNAL_DIR=path  keep the journal somewhere else
+MTCCG_JOURNAL=0         don't journal sessions
+"""
+import atexit
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from combo_manager import ID_WIDTH, drop_torn_tail, encode_combo_record, decode_combo_record
+
+JOURNAL_DIR = ".mtccg_journal"
+SEGMENT_BYTES = 8 * 1024 * 1024
+FLUSH_BYTES = 64 * 1024
+FLUSH_SECONDS = 2.0
+
+_SEGMENT_NAME = re.compile(r"^segment-(\d{6,})\.ndjson$")
+
+
+def journal_directory():
+    return os.environ.get("MTCCG_JOURNAL_DIR") or JOURNAL_DIR
+
+
+def segment_files(directory):
+    """Paths of the journal segments in order, oldest first"""
+    try:
+        names = [name for name in os.listdir(directory) if _SEGMENT_NAME.match(name)]
+    except FileNotFoundError:
+        return []
+    names.sort(key=lambda name: int(_SEGMENT_NAME.match(name).group(1)))
+    return [os.path.join(directory, name) for name in names]
+
+
+def _segment_path(directory, number):
+    return os.path.join(directory, f"segment-{number:06d}.ndjson")
+
+
+def session_record(kind, combinations, settings=None):
+    """Journal line of one session; seeded sessions only store their seed and settings"""
+    record = {"session": f"{time.time_ns():x}-{os.getpid():x}", "kind": kind,
+              "time": datetime.now().strftime('%Y-%m-%d %H:%M:%S'), "settings": settings or {}}
+    if getattr(combinations, "seed", None) is not None:
+        record["seeded"] = combinations.to_record()
+    else:
+        record["id_width"] = ID_WIDTH
+        record["combinations"] = [encode_combo_record(combo) for combo in combinations]
+    return record
+
+
+def session_combos(record):
+    """The combos of a journal record (a lazy SeededCombos for seeded sessions); ValueError for records
+    that can't be read back"""
+    try:
+        if "seeded" in record:
+            from seeded_combos import SeededCombos
+            return SeededCombos.from_record(record["seeded"])
+        return [decode_combo_record(combo, record.get("id_width", 1)) for combo in record["combinations"]]
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Incomplete journal record ({type(e).__name__}: {e})") from None
+
+
+class SessionJournal:
+    """Buffered writer for the active segment; safe to use from the timer thread and the main thread"""
+
+    def __init__(self, directory=None, segment_bytes=SEGMENT_BYTES, flush_bytes=FLUSH_BYTES,
+                 flush_seconds=FLUSH_SECONDS):
+        self.directory = directory or journal_directory()
+        self.segment_bytes = segment_bytes
+        self.flush_bytes = flush_bytes
+        self.flush_seconds = flush_seconds
+        self._lock = threading.Lock()
+        self._pending = []
+        self._pending_bytes = 0
+        self._timer = None
+        self._file = None
+        self._segment_number = None
+
+    def append(self, record):
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode()
+        with self._lock:
+            self._pending.append(line)
+            self._pending_bytes += len(line)
+            if self._pending_bytes >= self.flush_bytes:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Write and fsync everything buffered"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        data = b"".join(self._pending)
+        segment = self._open_segment(len(data))
+        segment.write(data)
+        segment.flush()
+        os.fsync(segment.fileno())
+        self._pending.clear()
+        self._pending_bytes = 0
+
+    def _open_segment(self, incoming):
+        """Active segment file, rotated to a new one when it would grow past segment_bytes"""
+        if self._file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            segments = segment_files(self.directory)
+            if segments:
+                self._segment_number = int(_SEGMENT_NAME.match(os.path.basename(segments[-1])).group(1))
+                # A crash can leave half a line at the end of the last segment
+                drop_torn_tail(segments[-1])
+            else:
+                self._segment_number = 1
+            self._file = open(_segment_path(self.directory, self._segment_number), "ab")
+        if self._file.tell() and self._file.tell() + incoming > self.segment_bytes:
+            self._file.close()
+            self._segment_number += 1
+            self._file = open(_segment_path(self.directory, self._segment_number), "ab")
+        return self._file
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_journal = None
+
+
+def get_journal():
+    """Shared journal for this process, flushed at exit"""
+    global _journal
+    if _journal is None:
+        _journal = SessionJournal()
+        atexit.register(_journal.close)
+    return _journal
+
+
+def record_session(kind, combinations, settings=None):
+    """Journal a generated session (never fails the session itself; returns False when it wasn't journaled)"""
+    if os.environ.get("MTCCG_JOURNAL", "1").lower() in ("0", "off", "no", "false"):
+        return False
+    try:
+        get_journal().append(session_record(kind, combinations, settings))
+        return True
+    except OSError:
+        return False
+
+
+def iter_journal(directory=None):
+    """Yield every journaled session once, oldest first
+
+    Torn or corrupt lines and records without a session ID are skipped, and sessions seen twice (left
+    behind by an interrupted compaction) are only yielded the first time.
+    """
+    seen = set()
+    for segment in segment_files(directory or journal_directory()):
+        with open(segment, "rb") as segment_file:
+            for line in segment_file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict) or not isinstance(record.get("session"), str) \
+                        or record["session"] in seen:
+                    continue
+                seen.add(record["session"])
+                yield record
+
+
+def compact_journal(directory=None, segment_bytes=SEGMENT_BYTES, before=None):
+    """Merge the closed segments into as few full segments as possible, dropping broken lines and,
+    with before ("YYYY-MM-DD ..."), sessions older than that. Returns (segments before, segments after).
+
+    Each merged segment is written to a temp file and renamed over the first segment it replaces
+    before the others are removed, so a crash halfway only leaves duplicates that iter_journal skips.
+    """
+    directory = directory or journal_directory()
+    segments = segment_files(directory)
+    closed = segments[:-1]
+    if not closed:
+        return len(segments), len(segments)
+
+    def records():
+        seen = set()
+        for segment in closed:
+            with open(segment, "rb") as segment_file:
+                for line in segment_file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if not isinstance(record, dict) or not isinstance(record.get("session"), str) \
+                            or record["session"] in seen:
+                        continue
+                    seen.add(record["session"])
+                    if before and record.get("time", "") < before:
+                        continue
+                    yield line if line.endswith(b"\n") else line + b"\n"
+
+    groups = []
+    current = []
+    size = 0
+    for line in records():
+        if current and size + len(line) > segment_bytes:
+            groups.append(current)
+            current, size = [], 0
+        current.append(line)
+        size += len(line)
+    if current:
+        groups.append(current)
+
+    from combo_manager import atomic_write
+    targets = closed[:len(groups)]
+    for target, lines in zip(targets, groups):
+        atomic_write(target, b"".join(lines).decode())
+    for leftover in closed[len(groups):]:
+        os.remove(leftover)
+    return len(segments), len(groups) + 1
+
+
+def rebuild_savefiles(output_directory=".", directory=None, since=None):
+    """Write a save file for every journaled session (since "YYYY-MM-DD ..." if given); returns the file names"""
+    from combo_manager import save_combo
+    written = []
+    for record in iter_journal(directory):
+        if since and record.get("time", "") < since:
+            continue
+        try:
+            combinations = session_combos(record)
+        except ValueError:
+            # A seeded session whose technique data changed can't be regenerated, nor can a broken record
+            continue
+        stamp = record.get("time", "").replace("-", "").replace(":", "").replace(" ", "-")
+        file_name = os.path.join(output_directory, f"{record.get('kind', 'session')}-{stamp}-{record['session']}")
+        success, message = save_combo(combinations, f"{record.get('kind', 'session')} {record.get('time', '')}", file_name)
+        if success:
+            written.append(file_name + ".json")
+    return written
@@ -1,13 +1,38 @@
 #File: technique_customizer.py
 import random
-from colorama import init, Fore, Style
-from techniques_data import specific_category_mapping, random_category_mapping
+from colorama import Fore, Style
+from techniques_data import specific_category_mapping
 from input_helpers import get_valid_input
-from combo_manager import save_combo, get_save_preferences
-init()
-
-
-def custom_combos():
+from combo_manager import save_combo, save_templates, get_save_preferences
+from combo_renderer import get_renderer
+from seeded_combos import SeededCombos
+from combo_templates import compile_template, parse_template
+from session_journal import record_session
+
+
+def resolve_custom_combo(customized_combo, rng=random):
+    """Replace the random_* placeholders of a custom combo with actual techniques"""
+    return compile_template(customized_combo).resolve_names(rng)
+
+
+def template_prompt():
+    """Ask for a typed template; returns the template items, or None to build the combos from the menus"""
+    print(Fore.GREEN + Style.BRIGHT + "\n Type a combo template, e.g. " + Style.RESET_ALL + Fore.WHITE +
+          "jab > cross > random:kicks > {knee|elbow} x2" + Style.RESET_ALL)
+    while True:
+        template_text = input(Fore.CYAN + "Template (or press Enter to pick techniques one by one): " + Style.RESET_ALL)
+        if not template_text.strip():
+            return None
+        try:
+            template = parse_template(template_text)
+        except ValueError as e:
+            print(Fore.RED + Style.BRIGHT + f" {e}" + Style.RESET_ALL)
+            continue
+        return list(template.items)
+
+
+def pick_combos_from_menus():
+    """Build the custom combos a technique at a time through the menus; None means back to the main menu"""
     cust_combo = get_valid_input(Fore.CYAN + Style.BRIGHT + "How many combos do you want?: " + Style.RESET_ALL, 1, 10,
  Fore.YELLOW + "Don't be lazy! Enter at least 1 combination." + Style.RESET_ALL,
  Fore.YELLOW + "Easy now! Max 10 combinations please." + Style.RESET_ALL)
@@ -17,7 +42,6 @@ def custom_combos():
  Fore.YELLOW + "Easy! Max 8 techniques please." + Style.RESET_ALL)
 
     all_customizations = []
-    saved_result_combo = []
     for combo_num in range(cust_combo):
         single_combo_custom = []
         for technique_pos in range(cust_techniques):
@@ -187,27 +211,25 @@ def custom_combos():
                         print(Fore.RED + Style.BRIGHT + " Invalid Input!" + Style.RESET_ALL)
 
         all_customizations.append(single_combo_custom)
+    return all_customizations
 
-        print(Fore.GREEN + Style.BRIGHT + "\n === CUSTOM COMBINATIONS GENERATED === " + Style.RESET_ALL)
-        for i, customized_combo in enumerate(all_customizations):
-            result_combo = []
-            for item in customized_combo:
-                if item in random_category_mapping:
-                    technique = random.choice(random_category_mapping[item])
-                    result_combo.append(technique)
-                else:
-                    result_combo.append(item)
-
-            saved_result_combo.append(result_combo)
 
-            colored_combo = []
-            colors = [Fore.YELLOW, Fore.GREEN, Fore.CYAN, Fore.MAGENTA, Fore.BLUE, Fore.WHITE]
-            for item, technique in enumerate(result_combo):
-                color = colors[i % len(colors)]
-                colored_combo.append(color + technique + Style.RESET_ALL)
+def custom_combos():
+    template = template_prompt()
+    if template is not None:
+        cust_combo = get_valid_input(Fore.CYAN + Style.BRIGHT + "How many combos do you want?: " + Style.RESET_ALL, 1, 10,
+ Fore.YELLOW + "Don't be lazy! Enter at least 1 combination." + Style.RESET_ALL,
+ Fore.YELLOW + "Easy now! Max 10 combinations please." + Style.RESET_ALL)
+        all_customizations = [template] * cust_combo
+    else:
+        all_customizations = pick_combos_from_menus()
+        if all_customizations is None:
+            return
 
-                print(Fore.RED + Style.BRIGHT + f"Custom Combination {i + 1}: " + Style.RESET_ALL + (
- Fore.WHITE + Style.BRIGHT + " → " + Style.RESET_ALL).join(colored_combo))
+    # Resolve the random placeholders once and print the whole set in one go
+    saved_result_combo = SeededCombos.custom(all_customizations)
+    get_renderer().write_session(saved_result_combo, "\n === CUSTOM COMBINATIONS GENERATED === ", "Custom Combination")
+    record_session("custom", saved_result_combo)
 
     preferences = get_save_preferences()
     if preferences['should_save']:
@@ -215,4 +237,14 @@ def custom_combos():
         if success:
             print(Fore.GREEN + Style.BRIGHT + message + Style.RESET_ALL)
         else:
-            print(Fore.RED + Style.BRIGHT + message + Style.RESET_ALL)
\ No newline at end of file
+            print(Fore.RED + Style.BRIGHT + message + Style.RESET_ALL)
+    # Templates with random techniques can be saved and re-rolled later (mtccg custom --template-file FILE -n 500)
+    if any(compile_template(customized_combo).variants() > 1 for customized_combo in all_customizations):
+        template_choice = input(Fore.MAGENTA + "Save these combos as templates to re-roll later?" + Style.BRIGHT + "(y/n)" + Style.RESET_ALL + Fore.MAGENTA + ": " + Style.RESET_ALL).lower()
+        if template_choice == 'y':
+            template_file = input(Fore.BLUE + Style.BRIGHT + "Enter template filename (without .mtct): " + Style.RESET_ALL)
+            success, message = save_templates(all_customizations, template_file, template_file)
+            if success:
+                print(Fore.GREEN + Style.BRIGHT + message + Style.RESET_ALL)
+            else:
+                print(Fore.RED + Style.BRIGHT + message + Style.RESET_ALL)
@@ -0,0 +1,110 @@
+# File: technique_search.py
+import re
+from collections import defaultdict
+
+# How much a match in each field counts towards a technique's score
+FIELD_WEIGHTS = {"name": 1.0, "description": 0.4, "tip": 0.2}
+# Query words must be at least this similar to an indexed word to count as a (typo tolerant) match
+MIN_WORD_SIMILARITY = 0.7
+MIN_SCORE = 0.25
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    return _WORD.findall(text.lower())
+
+
+def trigrams(word):
+    padded = f"${word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, limit=None):
+    """Levenshtein distance between two words (stops early once it is over limit)"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def word_similarity(query_word, word):
+    """1.0 for the same word, a little less for a prefix, otherwise scaled by edit distance"""
+    if query_word == word:
+        return 1.0
+    if word.startswith(query_word):
+        return 0.9
+    longest = max(len(query_word), len(word))
+    limit = int(longest * (1 - MIN_WORD_SIMILARITY))
+    distance = edit_distance(query_word, word, limit)
+    return 1 - distance / longest if distance <= limit else 0.0
+
+
+class TechniqueSearchIndex:
+    """Trigram index over the words of every technique's name, description and tip"""
+
+    def __init__(self, records):
+        self.names = [record['name'] for record in records]
+        self._lower_names = [name.lower() for name in self.names]
+        self._word_postings = defaultdict(list)
+        self._trigram_words = defaultdict(set)
+        for doc_id, record in enumerate(records):
+            for field in FIELD_WEIGHTS:
+                for word in set(tokenize(record.get(field, ""))):
+                    self._word_postings[word].append((doc_id, field))
+        for word in self._word_postings:
+            for trigram in trigrams(word):
+                self._trigram_words[trigram].add(word)
+
+    def _similar_words(self, query_word):
+        """Indexed words sharing enough trigrams with query_word, with their similarity"""
+        query_trigrams = trigrams(query_word)
+        shared = defaultdict(int)
+        for trigram in query_trigrams:
+            for word in self._trigram_words.get(trigram, ()):
+                shared[word] += 1
+        needed = max(1, len(query_trigrams) // 3)
+        similar = {}
+        for word, count in shared.items():
+            if count >= needed:
+                similarity = word_similarity(query_word, word)
+                if similarity:
+                    similar[word] = similarity
+        return similar
+
+    def search(self, term, limit=None):
+        """Return [(technique name, score)] best match first"""
+        query_words = tokenize(term)
+        if not query_words:
+            return []
+
+        # best[doc][field][i] = best similarity of query word i among the words of that field
+        best = defaultdict(lambda: defaultdict(lambda: [0.0] * len(query_words)))
+        for i, query_word in enumerate(query_words):
+            for word, similarity in self._similar_words(query_word).items():
+                for doc_id, field in self._word_postings[word]:
+                    field_scores = best[doc_id][field]
+                    if similarity > field_scores[i]:
+                        field_scores[i] = similarity
+
+        term = term.lower().strip()
+        name_hits = {doc_id for doc_id, name in enumerate(self._lower_names) if term in name}
+        results = []
+        for doc_id in name_hits.union(best):
+            fields = best.get(doc_id, {})
+            score = max((FIELD_WEIGHTS[field] * sum(scores) / len(scores) for field, scores in fields.items()), default=0.0)
+            name = self._lower_names[doc_id]
+            if term in name:
+                # Plain substring hits on the name (the old search) always rank first, exact names above those
+                score += 1.5 if term == name else 1.0
+            if score >= MIN_SCORE:
+                results.append((self.names[doc_id], round(score, 3)))
+        results.sort(key=lambda result: (-result[1], len(result[0]), result[0]))
+        return results[:limit] if limit else results
@@ -1,17 +1,30 @@
 #File name techniques_browser.py
 import math
-from colorama import init, Fore, Style
-from techniques_data import technique_info
-init()
+from colorama import Fore, Style
+from techniques_data import technique_info, technique_by_name
+from technique_search import TechniqueSearchIndex
+from instrumentation import timed
 
 
-def search_techniques(search_term):
-    matches = []
+_search_index = None
+
+
+def get_search_index():
+    """Search index over technique_info, built on the first search"""
+    global _search_index
+    if _search_index is None:
+        _search_index = TechniqueSearchIndex(technique_info)
+    return _search_index
+
 
-    for techniques in technique_info:
-        if search_term.lower() in techniques['name'].lower():
-            matches.append(techniques['name'])
-    return matches
+@timed("search.ranked")
+def search_techniques_ranked(search_term, limit=None):
+    """Return [(name, score)] for the techniques matching search_term, best match first"""
+    return get_search_index().search(search_term, limit)
+
+
+def search_techniques(search_term):
+    return [name for name, score in search_techniques_ranked(search_term)]
 
 def technique_details():
     print(
@@ -100,13 +113,7 @@ How would you like to find techniques?""" + Style.RESET_ALL)
                 try:
                     selected = int(input(Fore.CYAN + "Select technique number: " + Style.RESET_ALL))
                     if 1 <= selected <= len(matches):
-                        selected_technique_name = matches[selected - 1]
-                        selected_technique = None
-
-                        for technique in technique_info:
-                            if technique['name'] == selected_technique_name:
-                                selected_technique = technique
-                                break
+                        selected_technique = technique_by_name.get(matches[selected - 1])
 
                         if selected_technique:
                             print(
@@ -1,4 +1,6 @@
 #File name techniques_data.py
+from array import array
+
 #Advanced Techniques
 adv_punches = ["jab", "cross", "left hook", "right hook", "body cross", "left uppercut", "right uppercut", "left body hook", "right body hook", "body jab","superman punch", "left spinning back fist", "right spinning back fist"]
 adv_kicks = ["left low kick", "right low kick", "left body kick", "right body kick", "left head kick", "right head kick", "left teep (push kick)", "right teep (push kick)", "left spinning hook kick", "right spinning hook kick", "left spinning back kick", "right spinning back kick"]
@@ -16,274 +18,133 @@ beg_knee = ["left horizontal knee", "right horizontal knee"]
 specific_category_mapping = {"specific_kicks":adv_kicks, "specific_punches":adv_punches, "specific_elbows":adv_elbows, "specific_knees":adv_knee, "specific_fake_feints":fake_outs}
 random_category_mapping = {"random_kicks":adv_kicks, "random_punches":adv_punches, "random_elbows":adv_elbows, "random_knees":adv_knee, "random_fake_feints":fake_outs}
 
-#Techniques Information
-technique_info = [
- {
- "name": "jab",
- "description": "Quick straight punch with lead hand",
- "tip": "Keeping your right guard up, aim at the head area and snap it back quickly back to guard position, All in one motion"
- },
- {
- "name": "cross",
- "description": "Straight power punch with rear hand",
- "tip": "Keeping you left guard up, rotate your hips, pivot your back foot and snap it back quickly back to guard position, All in one motion"
+#Technique ID table (append only!) - a technique's ID is its position here and is what saved combos store
+technique_table = ["jab", "cross", "left hook", "right hook", "body cross", "left uppercut", "right uppercut", "left body hook", "right body hook", "body jab", "superman punch", "left spinning back fist", "right spinning back fist",
+"left low kick", "right low kick", "left body kick", "right body kick", "left head kick", "right head kick", "left teep (push kick)", "right teep (push kick)", "left spinning hook kick", "right spinning hook kick", "left spinning back kick", "right spinning back kick",
+"horizontal left elbow", "horizontal right elbow", "left upward elbow", "right upward elbow", "left downward elbow", "right downward elbow", "left spinning elbow", "right spinning elbow", "superman elbow",
+"left knee", "right knee", "left jumping knee", "right jumping knee", "right spear knee", "left spear knee",
+"feint-jab to cross", "feint-cross to left hook", "jab high punch low", "feint-jab then overhand right(or left hook)", "feint-jab to uppercut", "feint-strike to low kick",
+"fake low kick to head kick", "fake low kick to hook", "fake teep (push kick) to strike", "fake roundhouse kick to teep (push kick)", "fake switch kick to cross", "jab high to kick low", "jab to the body, then hook to the head",
+"level change to uppercut", "Dutch-style feinting (punch-kick,feint)", "The hesitation kick", "the kick-to-catch-and-sweep",
+"left horizontal knee", "right horizontal knee"]
+technique_ids = {name: technique_id for technique_id, name in enumerate(technique_table)}
+
+#Technique metadata used for combo flow: (side it's thrown with, range, whether it changes or resets the stance)
+technique_metadata = {
+"jab": ("left", "long", False), "cross": ("right", "long", False), "left hook": ("left", "mid", False), "right hook": ("right", "mid", False),
+"body cross": ("right", "mid", False), "left uppercut": ("left", "close", False), "right uppercut": ("right", "close", False),
+"left body hook": ("left", "mid", False), "right body hook": ("right", "mid", False), "body jab": ("left", "long", False),
+"superman punch": ("right", "long", True), "left spinning back fist": ("left", "mid", True), "right spinning back fist": ("right", "mid", True),
+"left low kick": ("left", "mid", False), "right low kick": ("right", "mid", False), "left body kick": ("left", "mid", False), "right body kick": ("right", "mid", False),
+"left head kick": ("left", "long", False), "right head kick": ("right", "long", False), "left teep (push kick)": ("left", "long", False), "right teep (push kick)": ("right", "long", False),
+"left spinning hook kick": ("left", "long", True), "right spinning hook kick": ("right", "long", True), "left spinning back kick": ("left", "long", True), "right spinning back kick": ("right", "long", True),
+"horizontal left elbow": ("left", "close", False), "horizontal right elbow": ("right", "close", False), "left upward elbow": ("left", "close", False), "right upward elbow": ("right", "close", False),
+"left downward elbow": ("left", "close", False), "right downward elbow": ("right", "close", False), "left spinning elbow": ("left", "close", True), "right spinning elbow": ("right", "close", True),
+"superman elbow": ("right", "mid", True),
+"left knee": ("left", "close", False), "right knee": ("right", "close", False), "left jumping knee": ("left", "mid", True), "right jumping knee": ("right", "mid", True),
+"right spear knee": ("right", "close", False), "left spear knee": ("left", "close", False),
+"feint-jab to cross": ("both", "long", False), "feint-cross to left hook": ("both", "mid", False), "jab high punch low": ("both", "long", False),
+"feint-jab then overhand right(or left hook)": ("both", "mid", False), "feint-jab to uppercut": ("both", "close", False), "feint-strike to low kick": ("both", "mid", False),
+"fake low kick to head kick": ("both", "long", False), "fake low kick to hook": ("both", "mid", False), "fake teep (push kick) to strike": ("both", "mid", False),
+"fake roundhouse kick to teep (push kick)": ("both", "long", False), "fake switch kick to cross": ("both", "long", True), "jab high to kick low": ("both", "long", False),
+"jab to the body, then hook to the head": ("both", "mid", False), "level change to uppercut": ("both", "close", False), "Dutch-style feinting (punch-kick,feint)": ("both", "mid", False),
+"The hesitation kick": ("both", "long", False), "the kick-to-catch-and-sweep": ("both", "mid", True),
+"left horizontal knee": ("left", "close", False), "right horizontal knee": ("right", "close", False)}
+RANGES = ("close", "mid", "long")
+#Kind of every technique, named like the random_* categories (punches, kicks, elbows, knees, fake_feints)
+technique_kinds = {name: kind for kind, categories in (("punches", (adv_punches, beg_punches)), ("kicks", (adv_kicks, beg_kicks)),
+                                                       ("elbows", (adv_elbows, beg_elbows)), ("knees", (adv_knee, beg_knee)),
+                                                       ("fake_feints", (fake_outs,)))
+                   for category in categories for name in category}
+KIND_ALIASES = {"punch": "punches", "punches": "punches", "kick": "kicks", "kicks": "kicks", "elbow": "elbows", "elbows": "elbows",
+                "knee": "knees", "knees": "knees", "fake": "fake_feints", "fakes": "fake_feints", "feint": "fake_feints",
+                "feints": "fake_feints", "fake_feints": "fake_feints"}
+
+
+def resolve_kind(kind):
+    """Normalise a technique kind such as "kick" or "Fakes" to its technique_kinds name"""
+    try:
+        return KIND_ALIASES[kind.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unknown technique kind: {kind!r} (use punches, kicks, elbows, knees or fakes)") from None
+
+
+# array typecode for combos held as technique IDs, one byte per technique while the table fits
+ID_TYPECODE = "B" if len(technique_table) <= 256 else "H"
+
+
+def encode_combo(combo):
+    """Pack a combination of technique names into an array of technique IDs"""
+    return array(ID_TYPECODE, [technique_ids[name] for name in combo])
+
+
+def decode_combo(combo):
+    """Resolve a combination of technique IDs back to names (names are passed through)"""
+    return [technique_table[item] if isinstance(item, int) else item for item in combo]
+
+
+def find_category_problems():
+    """Problems with the category lists and the ID table (cheap, checked at import)"""
+    problems = []
+    categories = {"adv_punches": adv_punches, "adv_kicks": adv_kicks, "adv_elbows": adv_elbows, "adv_knee": adv_knee,
+                  "fake_outs": fake_outs, "beg_punches": beg_punches, "beg_kicks": beg_kicks, "beg_elbows": beg_elbows,
+                  "beg_knee": beg_knee}
+    for category_name, category in categories.items():
+        seen = set()
+        for technique in category:
+            if technique in seen:
+                problems.append(f"{category_name}: duplicate entry {technique!r}")
+            seen.add(technique)
+            if technique not in technique_ids:
+                problems.append(f"{category_name}: {technique!r} is missing from technique_table")
+    if len(technique_ids) != len(technique_table):
+        problems.append("technique_table has duplicate names")
+    for name in technique_table:
+        if name not in technique_metadata:
+            problems.append(f"technique_metadata: no entry for {name!r}")
+    return problems
+
+
+def find_record_problems(records):
+    """Problems between technique_table and the technique_info records"""
+    problems = []
+    record_names = [record['name'] for record in records]
+    seen = set()
+    for name in record_names:
+        if name in seen:
+            problems.append(f"technique_info: duplicate record {name!r}")
+        seen.add(name)
+    for name in technique_table:
+        if name not in seen:
+            problems.append(f"technique_info: no record for {name!r}")
+    for name in seen:
+        if name not in technique_ids:
+            problems.append(f"technique_info: {name!r} isn't used by any category")
+    return problems
+
+
+def _load_technique_info():
+    """Import the records, check them against the category lists and build the lookup tables"""
+    from technique_info_data import technique_info
+    problems = find_record_problems(technique_info)
+    if problems:
+        raise ValueError("Technique data is inconsistent:\n  " + "\n  ".join(problems))
+    by_name = {record['name']: record for record in technique_info}
+    globals().update(technique_info=technique_info, technique_by_name=by_name,
+                     technique_by_id={technique_ids[name]: record for name, record in by_name.items()})
+
+
+_problems = find_category_problems()
+if _problems:
+    raise ValueError("Technique data is inconsistent:\n  " + "\n  ".join(_problems))
 
- },
- {
- "name": "left hook",
- "description": "A semicircular, looping punch thrown with the lead (left) hand. It targets the side of the opponent's head and is very powerful.",
- "tip": "Keeping your right guard up, rotate your hips, pivot your back foot and snap it back quickly back to guard position, All in one motion"
- },
- {
- "name": "right hook",
- "description": "The same semicircular, looping punch thrown with the rear (right) hand. It's often used as a finishing blow and is typically the fighter's most powerful hook.",
- "tip": "Keeping your left guard up, rotate your hips, pivot your back foot and snap it back quickly back to guard position, All in one motion"
- },
- {
- "name": "left uppercut",
- "description": "A short-range, vertical punch thrown in an upward motion with the lead (left) hand. It's used to attack the opponent's chin from below.",
- "tip": "Keeping your right guard up, shift your weight slightly to your front foot and bend your knees and waist, dropping your lead hand a little to load the punch. Explode upwards, driving through your legs, All in one motion."
- },
- {
- "name": "right uppercut",
- "description": "The same upward-angled punch thrown with the rear (right) hand. It's a devastating punch, especially in close-range exchanges.",
- "tip": "Keeping your left guard up, use the same mechanics as the left hook, but drive off your rear (right) foot, All in one motion."
- },
- {
- "name": "left body hook",
- "description": "A hook thrown with the lead (left) hand, but instead of targeting the head, it is aimed at the opponent's midsection, often at the ribs or liver area.",
- "tip": "Keeping your right guard up, crouch slightly and bend your knees and waist to change the angle of your punch, targeting the ribs or liver area. The mechanics are the same as a head hook (hip rotation, bent elbow), but the path is directed lower."
- },
- {
- "name": "right body hook",
- "description": "A hook thrown with the lead (right) hand, but instead of targeting the head, it is aimed at the opponent's midsection, often at the ribs area.",
- "tip": "Keeping your left guard up, crouch slightly and bend your knees and waist to change the angle of your punch, targeting the ribs area. The mechanics are the same as a head hook (hip rotation, bent elbow), but the path is directed lower."
- },
- {
- "name": "left low kick",
- "description": "A powerful roundhouse kick targeting the opponent's lead leg, usually the outer or inner thigh. It's thrown with the rear (left) leg.",
- "tip": "Generate power by stepping out and pivoting on your lead foot, driving your hips and shin through the target while maintaining a guard"
 
- },
- {
- "name": "right low kick",
- "description": "The same powerful roundhouse kick, but thrown with the rear (right) leg, targeting the opponent's lead leg.",
- "tip": "Generate power by stepping out and pivoting on your lead foot, driving your hips and shin through the target while maintaining a guard"
- },
- {
- "name": "left body kick",
- "description": " A powerful roundhouse kick targeting the opponent's torso (ribs, liver, arms). Thrown with the rear (left) leg.",
- "tip": "Focus on strong hip rotation and driving your shin through the target's torso, ensuring good balance and a strong guard."
- },
- {
- "name": "right body kick",
- "description": "The same powerful roundhouse kick, but thrown with the rear (right) leg, targeting the opponent's torso.",
- "tip": "Focus on strong hip rotation and driving your shin through the target's torso, ensuring good balance and a strong guard."
- },
- {
- "name": "left teep (push kick)",
- "description": "A straight push kick thrown with the lead (left) leg, often targeting the opponent's midsection or solar plexus.",
- "tip": "Shift weight back, chamber the knee high, and thrust the ball of the foot or heel directly forward into the target, retracting quickly"
- },
- {
- "name": "right teep (push kick)",
- "description": "A powerful push kick thrown with the rear (right) leg, targeting the midsection, hips, or even the face.",
- "tip": "Drive off the rear foot, bring the knee up, and thrust forward with the hip, aiming the ball of the foot or heel at the target."
- },
- {
- "name": "horizontal left elbow",
- "description": "A horizontal, slashing elbow strike thrown with the lead (left) hand, parallel to the ground. Often used to cut the opponent's brow or forehead, or target the jaw/temple.",
- "tip": " Rotate your hips and pivot on your lead foot to deliver a sharp, horizontal elbow strike, keeping the movement compact and your opposite hand up for defense."
- },
- {
- "name": "horizontal right elbow",
- "description": "A powerful horizontal elbow strike thrown with the rear (right) hand, parallel to the ground. Targets include the chin, temples, brow, or nose.",
- "tip": "Use strong hip rotation and a pivot on your rear foot to throw a powerful, horizontal elbow, maintaining a tight guard with your opposite hand"
- },
- {
- "name": "left horizontal knee",
- "description": "A powerful close-range knee strike, using the lead (left) leg",
- "tip": "Lift the knee, thrust it forward using hip and calf drive into the midsection or ribs, and push off the ball of the standing foot for power."
- },
- {
- "name": "right horizontal knee",
- "description": "A powerful close-range knee strike, similar to the lead horizontal knee but thrown with the rear (right) leg.",
- "tip": "Drive off the lead foot, lifting and thrusting the rear knee forward/upward, engaging the hip for power while maintaining a tight guard."
- },
- {
- "name": "body cross",
- "description": "A powerful punch thrown with the rear hand that crosses the body, generating force from the hips and torso and traveling in a straight line towards the opponent's body or midsection.",
- "tip": "Rotate your hips and pivot your rear foot to drive power through your core and into the punch. While keeping a tight guard"
- },
- {
- "name": "body jab",
- "description": "A quick, straight punch with the lead hand directed at the opponent's torso.",
- "tip": "Bend your knees and get low to shift your weight forward, using the jab to create an opening or wear down your opponent"
- },
- {
- "name": "superman punch",
- "description": "An explosive, flying punch where a fighter fakes a kick by lifting their knee, then quickly hops forward off the standing leg while extending a punch with the rear hand.",
- "tip": "Generate momentum and close the distance by jumping forward off your back leg as you throw the punch"
- },
- {
- "name": "left spinning back fist",
- "description": "A strike where a fighter turns their back towards the opponent and whips their left hand around, hitting with the back of the fist or forearm.",
- "tip": "Step across your body to create momentum, look over your shoulder at the target, and strike with the back of your left hand."
- },
- {
- "name": "right spinning back fist",
- "description": "Similar to the left spinning back fist, this strike uses the momentum of a turn to deliver a powerful blow with the back of the right fist.",
- "tip": "Take a step to the side with your left foot to initiate the spin and use the rotation of your torso to whip your right fist around"
- },
- {
- "name": "left spinning hook kick",
- "description": "A dynamic and powerful kick where a fighter spins on their standing foot, turning their back to the opponent, and whips their left leg in a horizontal hooking motion to strike with the heel. It is typically aimed at the head or temple.",
- "tip": "Focus on speed by turning your head quickly over your right shoulder to spot the target before snapping your left leg around."
- },
- {
- "name": "right spinning hook kick",
- "description": "Similar to the left version, this is a powerful spinning kick that uses the heel of the right foot to strike the opponent, often targeting the head.",
- "tip": "After turning your body, drive through with your hips as you extend your right leg in a hooking motion towards the target."
- },
- {
- "name": "left spinning back kick",
- "description": "A knockout technique where a fighter spins and extends their left leg straight back, driving their heel into the opponent. It is often aimed at the opponent's midsection or liver",
- "tip": "Drive your left heel straight back towards the target, leading the motion with your hips and keeping your toes pointed down."
- },
- {
- "name": "right spinning back kick",
- "description": "Similar to the left, this is a powerful kick where a fighter spins and thrusts their right heel straight back into the opponent's body.",
- "tip": "Initiate the spin by turning your body in one smooth motion, driving your heel directly into the target."
- },
- {
- "name": "left downward elbow",
- "description": "A short-range strike where the fighter brings their left elbow down in a vertical, chopping motion from 12 to 6 o'clock. It is often aimed at the top of the opponent's head or collarbone",
- "tip": "Chop your left elbow down with force, rotating your body to put more power behind the strike."
- },
- {
- "name": "right downward elbow",
- "description": "This is the same vertical, chopping elbow strike as the left downward elbow, but performed with the right arm.",
- "tip": "Elevate your right elbow by retracting your shoulder blade and turning your palm up to deliver a powerful, vertical strike."
- },
- {
- "name": "left spinning elbow",
- "description": "A strike where a fighter performs a full body spin and lands with the left elbow. The rotational force makes it an extremely powerful and surprising attack",
- "tip": "Use a step and body rotation to generate maximum momentum, hitting with the point of your left elbow."
- },
- {
- "name": "right spinning elbow",
- "description": "Similar to the left, this is a spinning elbow strike delivered with the right elbow. It requires careful timing but can be a devastating knockout blow",
- "tip": "Step across with your left foot to initiate the spin, turn your head to spot the target, and then unleash the rotating right elbow."
- },
- {
- "name": "superman elbow",
- "description": "An advanced, powerful elbow strike delivered by jumping forward, similar to a superman punch. It is used to close distance and deliver a cutting elbow strike to the opponent's head.",
- "tip": "Jump forward and land a slicing elbow as you close the distance, aiming for your opponent's eyebrow or forehead."
- },
- {
- "name": "left jumping knee",
- "description": "A knee strike where a fighter jumps with both feet and drives their left knee forward and up into the opponent's body or head. It can be used to catch an opponent off-guard or as a powerful finishing move",
- "tip": "Drive your hips and torso forward and jump explosively, pulling your left knee up towards your chest to generate force."
- },
- {
- "name": "right jumping knee",
- "description": "This is a jumping knee strike performed with the right knee, used to close distance and land a powerful strike. It is a high-risk, high-reward technique.",
- "tip": "Push off the ground explosively and drive your right knee upward, leaning your torso forward for balance and power."
- },
- {
- "name": "right spear knee",
- "description": "Also known as a stuffing knee, this is a powerful, straight-line knee strike where the fighter thrusts their right knee forward into the opponent's midsection. The hips drive the strike, making it a piercing blow.",
- "tip": "Thrust your hips forward powerfully as you drive your right knee straight into your opponent's midsection."
- },
- {
- "name": "left spear knee",
- "description": "The same powerful, straight-line knee strike as the right spear knee, but delivered with the left knee. It is an effective close-range technique for damaging an opponent's body",
- "tip": "Keep your heel directly under your knee as you drive it straight into your opponent, using your hips for maximum piercing force."
- },
-#FAKE OUT and FEINTS TECHNIQUES
- {
- "name": "feint-jab to cross",
- "description": "A deceptive combination where you throw a quick, light jab feint to draw a reaction, then immediately follow with a powerful cross punch.",
- "tip": "Make the feint jab convincing by extending it halfway, then quickly retract and throw the cross while your opponent is reacting to the fake jab."
- },
- {
- "name": "feint-cross to left hook",
- "description": "A feinting technique where you start to throw a cross punch to draw your opponent's guard to one side, then quickly pivot and deliver a left hook.",
- "tip": "Begin the cross motion to get your opponent to move their guard, then immediately rotate your hips and deliver the left hook to the opening created."
- },
- {
- "name": "jab high punch low",
- "description": "A level-changing combination where you throw a jab to the head to raise your opponent's guard, then immediately follow with a punch to the body.",
- "tip": "After throwing the high jab, quickly bend your knees and lower your stance to deliver a powerful body shot while their guard is up high."
- },
- {
- "name": "feint-jab then overhand right(or left hook)",
- "description": "A setup where you throw a feint jab to occupy your opponent's attention, then deliver either an overhand right or left hook depending on their reaction.",
- "tip": "Use the feint jab to gauge your opponent's defensive reaction, then choose the overhand right if they duck or the left hook if they move their guard."
- },
- {
- "name": "feint-jab to uppercut",
- "description": "A deceptive boxing combination where you throw a fake jab to raise the opponent's guard, then immediately follow with an uppercut from underneath.",
- "tip": "Make the jab feint convincing to bring their hands up, then quickly drop your level and drive an uppercut through the gap underneath their guard."
- },
- {
- "name": "feint-strike to low kick",
- "description": "A setup technique where you feint a punch or elbow to occupy your opponent's upper body defense, then quickly transition to a low kick attack.",
- "tip": "Use any striking feint to draw their attention and guard upward, then immediately pivot and deliver a powerful low kick to their legs."
- },
- {
- "name": "fake low kick to head kick (question mark kick)",
- "description": "A deceptive kicking combination where you start a low kick motion to draw the opponent's attention downward, then quickly snap the same leg up for a head kick.",
- "tip": "Begin the low kick chamber and motion, then when your opponent drops their guard or tries to check, quickly redirect the kick upward to the head."
- },
- {
- "name": "fake low kick to hook",
- "description": "A combination that starts with a fake low kick to get your opponent to react or drop their hands, then quickly step in with a hook punch.",
- "tip": "Use the fake low kick to create a distraction and opening, then quickly plant your kicking leg and pivot into a powerful hook."
- },
- {
- "name": "fake teep (push kick) to strike",
- "description": "A feinting technique where you chamber for a teep kick to create distance or a reaction, then quickly plant and deliver a punch or different strike.",
- "tip": "Lift your knee as if throwing a teep to make your opponent back up or react, then quickly step down and close distance with a strike."
- },
- {
- "name": "fake roundhouse kick to teep (push kick)",
- "description": "A kicking feint where you start a roundhouse motion to get your opponent to react or move, then quickly change to a straight teep kick.",
- "tip": "Begin the roundhouse chamber and hip rotation, then quickly straighten your leg and drive forward with a teep when your opponent reacts."
- },
- {
- "name": "fake switch kick to cross",
- "description": "A technique where you fake a switch kick (stepping and kicking with the opposite leg) then quickly plant and throw a cross punch.",
- "tip": "Start the switch step motion to make your opponent expect a kick, then quickly plant your feet and drive through with a cross punch."
- },
- {
- "name": "jab high to kick low",
- "description": "A high-low combination that uses a jab to the head to raise the opponent's guard, then follows with a low kick to attack the legs.",
- "tip": "Throw the jab to bring their hands up and their attention to head level, then immediately follow with a low kick while their legs are unprotected."
- },
- {
- "name": "jab to the body, then hook to the head",
- "description": "A level-changing combination that starts with a body jab to lower the opponent's guard, then follows with a hook to the head.",
- "tip": "Drive the body jab low to make your opponent bring their guard down, then quickly come back up with a hook to the head opening."
- },
- {
- "name": "level change to uppercut",
- "description": "A boxing technique where you drop your level as if going for a takedown or body shot, then explode upward with an uppercut.",
- "tip": "Bend your knees and lower your stance to make your opponent expect a body attack, then drive up explosively through your legs into the uppercut."
- },
- {
- "name": "Dutch-style feinting (punch-kick,feint)",
- "description": "A Dutch kickboxing approach that uses continuous feinting between punches and kicks to keep opponents guessing and create openings.",
- "tip": "Flow between punch and kick feints in combination, using the constant motion and threats to overwhelm your opponent's defense."
- },
- {
- "name": "The hesitation kick",
- "description": "A timing-based technique where you pause or hesitate mid-kick motion to throw off your opponent's timing, then complete the kick.",
- "tip": "Start your kick normally, then pause for a split second when your opponent begins to react, then complete the kick with full commitment."
- },
- {
- "name": "the kick-to-catch-and-sweep",
- "description": "An advanced technique where you throw a kick that your opponent catches, then immediately sweep their supporting leg or transition to another attack.",
- "tip": "When throwing the kick, be ready for the catch and immediately attack their base by sweeping their standing leg or grabbing their head for a knee."
- }
-]
\ No newline at end of file
+def __getattr__(name):
+    # technique_info (descriptions and tips) and its name/ID lookup tables are only needed by the browser,
+    # so they are built on first access. The generators, templates and save files only ever need a name's ID
+    # or an ID's name, which technique_ids and technique_table give without the records; going through
+    # technique_by_name/technique_by_id would load technique_info on every generate
+    if name in ("technique_info", "technique_by_name", "technique_by_id"):
+        _load_technique_info()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
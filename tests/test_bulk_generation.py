@@ -0,0 +1,39 @@
+# File: tests/test_bulk_generation.py
+import io
+import json
+
+import pytest
+
+from bulk_generation import derive_seed, generate_bulk_combo_ids, write_bulk_ndjson
+
+
+def test_derived_seeds_are_stable_and_distinct():
+    assert derive_seed(7, 3) == derive_seed(7, 3)
+    assert len({derive_seed(7, index) for index in range(1000)}) == 1000
+    assert derive_seed(7, 3) != derive_seed(8, 3)
+
+
+@pytest.mark.parametrize("flow", [False, True])
+def test_output_does_not_depend_on_the_worker_count(flow):
+    settings = (2500, 4, "adv", 1, "category", flow, 7)
+    single = list(generate_bulk_combo_ids(*settings, workers=1, shard_size=300))
+    parallel = list(generate_bulk_combo_ids(*settings, workers=3, shard_size=300))
+    assert len(single) == 2500 and all(len(combo) == 4 for combo in single)
+    assert parallel == single
+
+
+def test_ndjson_does_not_depend_on_the_worker_count():
+    outputs = []
+    for workers in (1, 3):
+        out = io.StringIO()
+        assert write_bulk_ndjson(out, 1000, 3, "beg", 1, seed=7, workers=workers, shard_size=128) == 1000
+        outputs.append(out.getvalue())
+    assert outputs[0] == outputs[1]
+    lines = outputs[0].splitlines()
+    assert [json.loads(line)["combo"] for line in lines] == list(range(1, 1001))
+
+
+def test_the_seed_decides_the_combos():
+    first = list(generate_bulk_combo_ids(200, 4, "adv", 1, seed=1, workers=1, shard_size=64))
+    assert first == list(generate_bulk_combo_ids(200, 4, "adv", 1, seed=1, workers=1, shard_size=64))
+    assert first != list(generate_bulk_combo_ids(200, 4, "adv", 1, seed=2, workers=1, shard_size=64))
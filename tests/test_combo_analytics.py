@@ -0,0 +1,38 @@
+# File: tests/test_combo_analytics.py
+from array import array
+
+import pytest
+
+import combo_analytics
+import combo_manager
+from combo_analytics import library_analytics
+from combo_manager import save_combo
+from techniques_data import ID_TYPECODE, technique_table
+
+
+@pytest.fixture
+def loads(tmp_path, monkeypatch):
+    """Paths passed to load_combo_file, by the manifest or by the analytics"""
+    monkeypatch.chdir(tmp_path)
+    save_combo([array(ID_TYPECODE, [0, 1]), array(ID_TYPECODE, [0])], "one", "one")
+    save_combo([array(ID_TYPECODE, [2, 0, 1])], "two", "two", "ndjson")
+    (tmp_path / combo_manager.MANIFEST_NAME).unlink()
+    paths = []
+    original = combo_manager.load_combo_file
+
+    def load_combo_file(path):
+        paths.append(path)
+        return original(path)
+
+    monkeypatch.setattr(combo_manager, "load_combo_file", load_combo_file)
+    monkeypatch.setattr(combo_analytics, "load_combo_file", load_combo_file)
+    return paths
+
+
+def test_a_cold_run_reads_each_file_once(loads):
+    analytics = library_analytics()
+    assert sorted(loads) == ["./one.json", "./two.ndjson"]
+    assert (analytics["files"], analytics["files_read"], analytics["combos"]) == (2, 2, 3)
+    assert analytics["techniques"][technique_table[0]] == 3
+    loads.clear()
+    assert library_analytics()["files_read"] == 0 and loads == []
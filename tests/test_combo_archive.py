@@ -0,0 +1,71 @@
+# File: tests/test_combo_archive.py
+import os
+import stat
+from array import array
+
+import pytest
+
+from combo_archive import ComboArchive, write_archive
+from techniques_data import ID_TYPECODE
+
+COMBOS = [array(ID_TYPECODE, [1, 2, 3]), array(ID_TYPECODE), array(ID_TYPECODE, [40]),
+          array(ID_TYPECODE, range(20))]
+
+
+@pytest.fixture
+def archive_file(tmp_path):
+    file_name = str(tmp_path / "set.mtca")
+    assert write_archive(file_name, iter(COMBOS), "my set", "2026-01-01 10:00:00") == len(COMBOS)
+    return file_name
+
+
+def test_round_trip(archive_file):
+    with ComboArchive(archive_file) as archive:
+        assert archive.metadata == {"name": "my set", "created": "2026-01-01 10:00:00"}
+        assert len(archive) == len(COMBOS)
+        assert list(archive) == COMBOS
+        assert archive.total_techniques == sum(len(combo) for combo in COMBOS)
+
+
+def test_random_access(archive_file):
+    with ComboArchive(archive_file) as archive:
+        assert archive[2] == COMBOS[2]
+        assert archive[-1] == COMBOS[-1]
+        assert archive[1:3] == COMBOS[1:3]
+        assert archive.page(2, 3) == COMBOS[3:]
+        with pytest.raises(IndexError):
+            archive[len(COMBOS)]
+
+
+def test_name_lists_are_encoded(tmp_path):
+    file_name = str(tmp_path / "names.mtca")
+    write_archive(file_name, [[5, 6]], "names")
+    with ComboArchive(file_name) as archive:
+        assert archive[0] == array(ID_TYPECODE, [5, 6])
+
+
+def test_empty_archive(tmp_path):
+    file_name = str(tmp_path / "empty.mtca")
+    write_archive(file_name, [], "empty")
+    with ComboArchive(file_name) as archive:
+        assert len(archive) == 0 and list(archive) == [] and archive.total_techniques == 0
+
+
+def test_truncated_archive_is_rejected(archive_file):
+    with open(archive_file, "r+b") as file:
+        file.truncate(os.path.getsize(archive_file) - 4)
+    with pytest.raises(ValueError):
+        ComboArchive(archive_file)
+
+
+def test_other_files_are_rejected(tmp_path):
+    file_name = tmp_path / "not.mtca"
+    file_name.write_bytes(b"{}" * 40)
+    with pytest.raises(ValueError):
+        ComboArchive(str(file_name))
+
+
+def test_archive_permissions_follow_the_umask(archive_file):
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(os.stat(archive_file).st_mode) == 0o666 & ~umask
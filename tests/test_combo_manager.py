@@ -0,0 +1,114 @@
+# File: tests/test_combo_manager.py
+import json
+from array import array
+
+import pytest
+
+import combo_manager
+from combo_manager import decode_combo_record, encode_combo_record, get_savefile_index, load_combo_file, save_combo
+from techniques_data import ID_TYPECODE, decode_combo
+
+COMBOS = [array(ID_TYPECODE, [0, 1, 13]), array(ID_TYPECODE, [25, 34])]
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.mark.parametrize("file_format,extension", [("json", ".json"), ("ndjson", ".ndjson"), ("archive", ".mtca")])
+def test_round_trip(file_format, extension):
+    assert save_combo(COMBOS, "my set", "set", file_format) == (True, "File saved successfully")
+    combo_data, message = load_combo_file("set" + extension)
+    assert combo_data['name'] == "my set"
+    assert list(combo_data['combinations']) == COMBOS
+
+
+def test_name_lists_round_trip():
+    names = [["jab", "cross"], ["left low kick"]]
+    save_combo(names, "names", "names")
+    assert load_combo_file("names.json")[0]['combinations'] == names
+
+
+def test_records_are_little_endian_with_their_width():
+    assert encode_combo_record(array("B", [1, 2]), 2) == "01000200"
+    assert decode_combo_record("0100ff00", 2) == array(ID_TYPECODE, [1, 255])
+    assert decode_combo_record("01ff") == array(ID_TYPECODE, [1, 255])
+    with pytest.raises(ValueError):
+        decode_combo_record("01", 3)
+
+
+def test_files_store_the_id_width():
+    save_combo(COMBOS, "set", "set")
+    save_combo(COMBOS, "set", "set", "ndjson")
+    assert json.load(open("set.json"))["id_width"] == array(ID_TYPECODE).itemsize
+    assert json.loads(open("set.ndjson").readline())["id_width"] == array(ID_TYPECODE).itemsize
+
+
+def test_files_without_a_width_are_one_byte_per_technique():
+    with open("old.json", "w") as old_file:
+        json.dump({"name": "old", "encoding": "technique_ids", "combinations": ["00010d"]}, old_file)
+    assert load_combo_file("old.json")[0]['combinations'] == [array(ID_TYPECODE, [0, 1, 13])]
+
+
+def test_two_byte_files_load():
+    with open("wide.ndjson", "w") as wide_file:
+        wide_file.write('{"name":"wide","format":"mtccg-ndjson","id_width":2}\n"00000100"\n')
+    assert load_combo_file("wide.ndjson")[0]['combinations'] == [array(ID_TYPECODE, [0, 1])]
+
+
+def test_ndjson_append_and_torn_tail():
+    save_combo(COMBOS[:1], "set", "set", "ndjson")
+    with open("set.ndjson", "a") as ndjson_file:
+        ndjson_file.write('"0a0b')
+    # The torn record is skipped when loading and cut off before appending
+    assert load_combo_file("set.ndjson")[0]['combinations'] == COMBOS[:1]
+    assert save_combo(COMBOS[1:], "set", "set", "ndjson", append=True)[0]
+    assert load_combo_file("set.ndjson")[0]['combinations'] == COMBOS
+
+
+def test_streamed_ndjson_loads():
+    with open("streamed.ndjson", "w") as ndjson_file:
+        ndjson_file.write('{"combo":1,"techniques":["jab","cross"]}\n{"combo":2,"techniques":["left knee"]}\n')
+    combo_data, message = load_combo_file("streamed.ndjson")
+    assert combo_data['name'] == "streamed"
+    assert combo_data['combinations'] == [["jab", "cross"], ["left knee"]]
+    assert [entry['filename'] for entry in get_savefile_index()] == ["streamed.ndjson"]
+
+
+def test_appending_to_streamed_ndjson_keeps_its_form():
+    with open("streamed.ndjson", "w") as ndjson_file:
+        ndjson_file.write('{"combo":1,"techniques":["jab","cross"]}\n{"combo":2,"techniques":["left knee"]}\n{"co')
+    assert save_combo(COMBOS, "ignored", "streamed", "ndjson", append=True)[0]
+    with open("streamed.ndjson") as ndjson_file:
+        assert [json.loads(line)["combo"] for line in ndjson_file] == [1, 2, 3, 4]
+    combinations = load_combo_file("streamed.ndjson")[0]['combinations']
+    assert combinations[2:] == [decode_combo(combo) for combo in COMBOS]
+    assert get_savefile_index()[0]["total_combos"] == 4
+
+
+def test_manifest_counts_without_reading_files_back(monkeypatch):
+    save_combo(COMBOS, "set", "set", "ndjson")
+    loads = []
+    monkeypatch.setattr(combo_manager, "load_combo_file", lambda *args: loads.append(args))
+    save_combo(COMBOS, "set", "set", "ndjson", append=True)
+    save_combo(COMBOS, "other", "other")
+    assert loads == []
+    monkeypatch.setattr(combo_manager, "load_combo_file", load_combo_file)
+    index = {entry['filename']: entry for entry in get_savefile_index()}
+    assert (index["set.ndjson"]["total_combos"], index["set.ndjson"]["total_techniques"]) == (4, 10)
+    assert (index["other.json"]["total_combos"], index["other.json"]["name"]) == (2, "other")
+
+
+def test_manifest_picks_up_changed_files():
+    save_combo(COMBOS, "set", "set", "ndjson")
+    with open("set.ndjson", "a") as ndjson_file:
+        ndjson_file.write('"0102"\n')
+    assert get_savefile_index()[0]["total_combos"] == 3
+
+
+def test_invalid_files_are_not_listed():
+    with open("broken.json", "w") as broken_file:
+        broken_file.write("{nope")
+    save_combo(COMBOS, "set", "set")
+    assert [entry['filename'] for entry in get_savefile_index()] == ["set.json"]
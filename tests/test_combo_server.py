@@ -0,0 +1,56 @@
+# File: tests/test_combo_server.py
+import asyncio
+import json
+from array import array
+
+import pytest
+
+from combo_manager import save_combo
+from combo_server import ComboServer, ComboService
+from techniques_data import ID_TYPECODE, decode_combo
+
+
+def exchange(directory, *requests):
+    """Send each raw request on its own connection and return the (status, body) answers"""
+    async def run():
+        server = ComboServer(ComboService(directory), log=False)
+        listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        answers = []
+        async with listener:
+            for request in requests:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(request)
+                await writer.drain()
+                head, _, body = (await reader.read()).partition(b"\r\n\r\n")
+                writer.close()
+                answers.append((int(head.split()[1]), json.loads(body)))
+        return answers
+    return asyncio.run(run())
+
+
+def get(path):
+    return f"GET {path} HTTP/1.1\r\nConnection: close\r\n\r\n".encode()
+
+
+@pytest.fixture
+def save_directory(tmp_path):
+    save_combo([array(ID_TYPECODE, [0, 1]), array(ID_TYPECODE, [2])], "my set", str(tmp_path / "set"))
+    (tmp_path / "notes.txt").write_text("private")
+    return str(tmp_path)
+
+
+def test_bad_requests_get_400(save_directory):
+    answers = exchange(save_directory, b"NONSENSE\r\n\r\n", get("/generate?count=lots"),
+                       get("/generate?difficulty=pro"), get("/files/set.json?start=9"),
+                       b'POST /custom HTTP/1.1\r\nConnection: close\r\nContent-Length: 5\r\n\r\n[1,2]')
+    assert [status for status, body in answers] == [400] * 5
+    assert all("error" in body for status, body in answers)
+
+
+def test_only_save_files_in_the_directory_can_be_read(save_directory):
+    answers = exchange(save_directory, get("/files/set.json"), get("/files/notes.txt"),
+                       get("/files/..%2Fset.json"), get("/files/%2Fetc%2Fpasswd"), get("/files/a%00.json"))
+    status, body = answers[0]
+    assert (status, body["name"], body["combinations"]) == (200, "my set", [decode_combo([0, 1]), decode_combo([2])])
+    assert [status for status, body in answers[1:]] == [404] * 4
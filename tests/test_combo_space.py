@@ -0,0 +1,93 @@
+# File: tests/test_combo_space.py
+import random
+from itertools import product
+
+import pytest
+
+from combo_registry import get_sampler
+from combo_space import ComboSpace, count_combos
+from techniques_data import technique_kinds, technique_table
+
+
+def brute_force(difficulty, choice, length, require=(), start_with=None, end_with=None):
+    """Every valid combo (tuples of technique IDs), by enumerating the whole space"""
+    ids = get_sampler(difficulty, choice).ids
+    valid = set()
+    for combo in product(ids, repeat=length):
+        kinds = [technique_kinds[technique_table[technique_id]] for technique_id in combo]
+        if all(kind in kinds for kind in require) and (not start_with or kinds[0] == start_with) \
+                and (not end_with or kinds[-1] == end_with):
+            valid.add(combo)
+    return valid
+
+
+@pytest.mark.parametrize("constraints", [
+    {},
+    {"require": ["kicks"]},
+    {"require": ["kicks", "knees"]},
+    {"start_with": "knees"},
+    {"require": ["knees"], "end_with": "kicks"},
+    {"start_with": "kicks", "end_with": "kicks"},
+])
+def test_count_and_unrank_match_brute_force(constraints):
+    space = ComboSpace("beg", 3, 3, **constraints)
+    expected = brute_force("beg", 3, 3, **constraints)
+    assert space.count == len(expected)
+    assert {tuple(space.unrank(rank)) for rank in range(space.count)} == expected
+
+
+def test_kind_aliases_are_accepted():
+    assert count_combos("beg", 3, 3, require=["Kick"], start_with="knee") == \
+        count_combos("beg", 3, 3, require=["kicks"], start_with="knees")
+
+
+def test_unknown_kind_raises():
+    with pytest.raises(ValueError):
+        ComboSpace("beg", 3, 3, require=["headbutts"])
+
+
+def test_unsatisfiable_constraints():
+    # Drill 3 is kicks and knees only
+    space = ComboSpace("beg", 3, 2, require=["punches"])
+    assert space.count == 0
+    with pytest.raises(ValueError):
+        space.sample()
+
+
+def test_more_required_kinds_than_positions():
+    assert count_combos("beg", 1, 2, require=["punches", "kicks", "knees"]) == 0
+
+
+def test_unrank_out_of_range():
+    space = ComboSpace("beg", 5, 2)
+    with pytest.raises(IndexError):
+        space.unrank(space.count)
+    with pytest.raises(IndexError):
+        space.unrank(-1)
+
+
+def test_samples_meet_the_constraints():
+    space = ComboSpace("adv", 1, 5, require=["fakes"], start_with="punches", end_with="kicks")
+    rng = random.Random(1)
+    for combo in space.sample_many(200, rng):
+        kinds = [technique_kinds[technique_table[technique_id]] for technique_id in combo]
+        assert "fake_feints" in kinds and kinds[0] == "punches" and kinds[-1] == "kicks"
+
+
+def test_unique_samples():
+    space = ComboSpace("beg", 5, 2)
+    combos = space.sample_many(space.count, random.Random(2), unique=True)
+    assert len({tuple(combo) for combo in combos}) == space.count
+    with pytest.raises(ValueError):
+        space.sample_many(space.count + 1, unique=True)
+
+
+def test_huge_space_is_counted_exactly():
+    assert count_combos("adv", 1, 30) == 57 ** 30
+
+
+def test_unique_samples_from_a_huge_space_keep_the_draw_order():
+    space = ComboSpace("adv", 1, 30)
+    rng = random.Random(3)
+    ranks = [rng.randrange(space.count) for _ in range(20)]
+    assert space.sample_many(20, random.Random(3), unique=True) == [space.unrank(rank) for rank in ranks]
@@ -0,0 +1,75 @@
+# File: tests/test_combo_templates.py
+import random
+
+import pytest
+
+from combo_templates import MAX_TEMPLATE_LENGTH, compile_template, parse_template, parse_template_lines
+from techniques_data import adv_kicks, adv_knee, adv_elbows, technique_ids
+
+
+def ids(names):
+    return {technique_ids[name] for name in names}
+
+
+def test_steps_and_kinds():
+    template = parse_template("Jab > cross > random:kicks > knee")
+    assert template.items == ("jab", "cross", "random_kicks", "random_knees")
+    assert set(template.positions[2]) == ids(adv_kicks)
+
+
+def test_alternatives_and_repeats():
+    template = parse_template("jab > {knee|elbow} x2 > kick*2")
+    assert template.items == ("jab", "{random_knees|random_elbows}", "{random_knees|random_elbows}",
+                              "random_kicks", "random_kicks")
+    assert set(template.positions[1]) == ids(adv_knee) | ids(adv_elbows)
+
+
+def test_old_comma_form_keeps_names_with_commas():
+    template = parse_template("jab, jab to the body, then hook to the head, random_kicks")
+    assert template.items == ("jab", "jab to the body, then hook to the head", "random_kicks")
+
+
+def test_parse_is_cached():
+    assert parse_template("jab > cross") is parse_template("jab > cross")
+    assert compile_template(["jab", "cross"]) is compile_template(("jab", "cross"))
+
+
+@pytest.mark.parametrize("source,message", [
+    ("jab > > cross", "Step 2 is empty"),
+    ("jab > crosss", "did you mean 'cross'"),
+    ("jab x0", "Repeat counts"),
+    (f"jab x{MAX_TEMPLATE_LENGTH} > cross", "at most"),
+    ("{jab|uppercutz}", "Unknown technique"),
+])
+def test_errors(source, message):
+    with pytest.raises(ValueError, match=message):
+        parse_template(source)
+
+
+def test_unknown_items_in_compiled_templates():
+    with pytest.raises(ValueError):
+        compile_template(["jab", "flying armbar"])
+    with pytest.raises(ValueError):
+        compile_template([])
+
+
+def test_resolve_and_reroll_stay_in_the_template():
+    template = parse_template("jab > {knee|elbow} > random:kicks")
+    allowed = [set(choices) for choices in template.positions]
+    combos = template.reroll(300, random.Random(1)) + [template.resolve(random.Random(i)) for i in range(50)]
+    for combo in combos:
+        assert len(combo) == 3
+        assert all(technique_id in choices for technique_id, choices in zip(combo, allowed))
+
+
+def test_seeded_resolve_is_reproducible():
+    template = parse_template("random:punches x4")
+    assert template.resolve(random.Random(7)) == template.resolve(random.Random(7))
+    assert template.variants() == len(template.positions[0]) ** 4
+
+
+def test_template_lines_report_every_problem():
+    templates, problems = parse_template_lines(["# warm-up", "", "jab > cross", "jab > nope", "kick x2", "x > y"])
+    assert [template.items for template in templates] == [("jab", "cross"), ("random_kicks", "random_kicks")]
+    assert len(problems) == 2
+    assert problems[0].startswith("Line 4: ") and problems[1].startswith("Line 6: ")
@@ -0,0 +1,75 @@
+# File: tests/test_seeded_combos.py
+import random
+
+import pytest
+
+import combo_templates
+from bulk_generation import derive_seed
+from random_combo_generator import generate_combo_ids
+from seeded_combos import BLOCK_SIZE, DataChanged, SeededCombos
+from techniques_data import adv_knee, random_category_mapping
+
+
+@pytest.mark.parametrize("flow", [False, True])
+def test_random_access_matches_iteration(flow):
+    combos = SeededCombos.generate(BLOCK_SIZE * 2 + 5, 4, "adv", 1, flow=flow, seed=11)
+    drawn = list(combos)
+    again = SeededCombos.from_record(combos.to_record())
+    assert again[len(drawn) - 1] == drawn[-1]
+    assert again[BLOCK_SIZE - 1:BLOCK_SIZE + 2] == drawn[BLOCK_SIZE - 1:BLOCK_SIZE + 2]
+    assert list(again) == drawn
+    assert combos.total_techniques == sum(len(combo) for combo in drawn)
+
+
+def test_seed_decides_the_combos():
+    assert list(SeededCombos.generate(50, 3, "beg", 1, seed=1)) == list(SeededCombos.generate(50, 3, "beg", 1, seed=1))
+    assert list(SeededCombos.generate(50, 3, "beg", 1, seed=1)) != list(SeededCombos.generate(50, 3, "beg", 1, seed=2))
+
+
+def test_saves_without_block_size_use_one_seed_per_combo():
+    record = SeededCombos.generate(5, 3, "beg", 1, seed=9).to_record()
+    del record["params"]["block_size"]
+    combos = SeededCombos.from_record(record)
+    assert list(combos) == [generate_combo_ids(1, 3, "beg", 1, rng=random.Random(derive_seed(9, i)))[0]
+                            for i in range(5)]
+
+
+def test_custom_combos_cycle_through_templates():
+    combos = SeededCombos.custom([["jab", "random_kicks"], ["cross"]], 5, seed=3)
+    assert [len(combo) for combo in combos] == [2, 1, 2, 1, 2]
+    assert combos.total_techniques == 8
+
+
+@pytest.fixture
+def fresh_templates():
+    combo_templates._compile.cache_clear()
+    yield
+    combo_templates._compile.cache_clear()
+
+
+@pytest.mark.parametrize("template", [["random_knees"], ["{random_knees|random_elbows}"], ["jab", "random_knees"]])
+def test_changed_technique_data_is_detected(template, monkeypatch, fresh_templates):
+    record = SeededCombos.custom([template], 3, seed=5).to_record()
+    monkeypatch.setitem(random_category_mapping, "random_knees", adv_knee[:-1])
+    combo_templates._compile.cache_clear()
+    with pytest.raises(DataChanged):
+        SeededCombos.from_record(record)
+
+
+def test_removed_template_items_are_detected(fresh_templates):
+    record = SeededCombos.custom([["jab"]], 3, seed=5).to_record()
+    record["params"]["templates"] = [["flying armbar"]]
+    with pytest.raises(DataChanged):
+        SeededCombos.from_record(record)
+
+
+def test_saves_from_before_the_fingerprint_version_still_load(monkeypatch, fresh_templates):
+    # Written before every template position was fingerprinted
+    record = {"seed": 5, "total_combos": 4, "fingerprint": "3255c1506a9d785c",
+              "params": {"generator": "custom", "templates": [["jab", "random_kicks"], ["{random_knees|random_elbows}"]],
+                         "block_size": 1024}}
+    assert [list(combo) for combo in SeededCombos.from_record(record)] == [[0, 24], [36], [0, 16], [37]]
+    monkeypatch.setitem(random_category_mapping, "random_kicks", random_category_mapping["random_kicks"][:-1])
+    combo_templates._compile.cache_clear()
+    with pytest.raises(DataChanged):
+        SeededCombos.from_record(record)
@@ -0,0 +1,105 @@
+# File: tests/test_session_journal.py
+import json
+from array import array
+
+import pytest
+
+from combo_manager import drop_torn_tail
+from session_journal import SessionJournal, compact_journal, iter_journal, rebuild_savefiles, segment_files, \
+    session_combos, session_record
+from techniques_data import ID_TYPECODE
+
+COMBOS = [array(ID_TYPECODE, [1, 2]), array(ID_TYPECODE, [3, 4, 5])]
+
+
+@pytest.fixture
+def journal_dir(tmp_path):
+    return str(tmp_path / "journal")
+
+
+def write_sessions(directory, count, **options):
+    journal = SessionJournal(directory, **options)
+    records = [dict(session_record("training", COMBOS), session=f"s{i}") for i in range(count)]
+    for record in records:
+        journal.append(record)
+    journal.close()
+    return records
+
+
+def test_sessions_come_back_in_order(journal_dir):
+    records = write_sessions(journal_dir, 3)
+    replayed = list(iter_journal(journal_dir))
+    assert [record["session"] for record in replayed] == ["s0", "s1", "s2"]
+    assert session_combos(replayed[0]) == COMBOS
+    assert replayed == json.loads(json.dumps(records))
+
+
+def test_nothing_is_written_before_a_flush(journal_dir):
+    journal = SessionJournal(journal_dir, flush_seconds=60)
+    journal.append(session_record("training", COMBOS))
+    assert list(iter_journal(journal_dir)) == []
+    journal.close()
+    assert len(list(iter_journal(journal_dir))) == 1
+
+
+def test_segments_rotate(journal_dir):
+    write_sessions(journal_dir, 10, segment_bytes=300, flush_bytes=1)
+    assert len(segment_files(journal_dir)) > 1
+    assert len(list(iter_journal(journal_dir))) == 10
+
+
+def test_torn_tail_is_dropped_before_appending(journal_dir):
+    write_sessions(journal_dir, 2)
+    segment = segment_files(journal_dir)[-1]
+    with open(segment, "ab") as segment_file:
+        segment_file.write(b'{"session":"torn","kind":"tra')
+    # The torn line is skipped when reading...
+    assert [record["session"] for record in iter_journal(journal_dir)] == ["s0", "s1"]
+    # ...and cut off before the next session is appended after it
+    journal = SessionJournal(journal_dir)
+    journal.append(dict(session_record("custom", COMBOS), session="s2"))
+    journal.close()
+    assert [record["session"] for record in iter_journal(journal_dir)] == ["s0", "s1", "s2"]
+
+
+def test_drop_torn_tail(tmp_path):
+    file_name = tmp_path / "lines"
+    file_name.write_bytes(b"one\ntwo\nthr")
+    drop_torn_tail(str(file_name), block_size=2)
+    assert file_name.read_bytes() == b"one\ntwo\n"
+    drop_torn_tail(str(file_name))
+    assert file_name.read_bytes() == b"one\ntwo\n"
+    file_name.write_bytes(b"no newline at all")
+    drop_torn_tail(str(file_name))
+    assert file_name.read_bytes() == b"no newline at all"
+
+
+def test_compaction_merges_closed_segments_and_skips_duplicates(journal_dir):
+    write_sessions(journal_dir, 12, segment_bytes=300, flush_bytes=1)
+    segments = segment_files(journal_dir)
+    # A duplicate left behind by an interrupted compaction
+    with open(segments[0], "rb") as first, open(segments[1], "ab") as second:
+        second.write(first.readline())
+    before = [record["session"] for record in iter_journal(journal_dir)]
+    assert compact_journal(journal_dir, segment_bytes=10 ** 6) == (len(segments), 2)
+    assert [record["session"] for record in iter_journal(journal_dir)] == before
+
+
+def test_compaction_drops_old_sessions(journal_dir):
+    journal = SessionJournal(journal_dir, segment_bytes=1, flush_bytes=1)
+    for day in ("2026-01-01", "2026-02-01", "2026-03-01"):
+        journal.append(dict(session_record("training", COMBOS), session=day, time=f"{day} 10:00:00"))
+    journal.close()
+    compact_journal(journal_dir, before="2026-02-01")
+    assert [record["session"] for record in iter_journal(journal_dir)] == ["2026-02-01", "2026-03-01"]
+
+
+def test_incomplete_records_are_skipped(journal_dir, tmp_path):
+    write_sessions(journal_dir, 1)
+    with open(segment_files(journal_dir)[-1], "ab") as segment_file:
+        segment_file.write(b'{"kind":"training","combinations":["0102"]}\n{"session":"s1","kind":"training"}\n')
+    assert [record["session"] for record in iter_journal(journal_dir)] == ["s0", "s1"]
+    with pytest.raises(ValueError):
+        session_combos({"session": "s1", "kind": "training"})
+    written = rebuild_savefiles(str(tmp_path), journal_dir)
+    assert len(written) == 1 and "s0" in written[0]
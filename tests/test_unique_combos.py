@@ -0,0 +1,66 @@
+# File: tests/test_unique_combos.py
+import random
+from itertools import product
+
+import pytest
+
+from combo_registry import get_sampler
+from unique_combos import (ComboSpaceTooSmall, combo_space_size, generate_constrained_combo_ids,
+                           generate_unique_combo_ids, unrank_combo)
+
+CONSTRAINTS = [(False, False), (True, False), (False, True)]
+
+
+def allowed(combo, no_immediate_repeat, no_repeat_within):
+    if no_repeat_within:
+        return len(set(combo)) == len(combo)
+    if no_immediate_repeat:
+        return all(a != b for a, b in zip(combo, combo[1:]))
+    return True
+
+
+@pytest.mark.parametrize("no_immediate_repeat,no_repeat_within", CONSTRAINTS)
+def test_space_size_and_unrank_cover_the_space(no_immediate_repeat, no_repeat_within):
+    technique_count, length = 5, 3
+    expected = {combo for combo in product(range(technique_count), repeat=length)
+                if allowed(combo, no_immediate_repeat, no_repeat_within)}
+    space = combo_space_size(technique_count, length, no_immediate_repeat, no_repeat_within)
+    assert space == len(expected)
+    assert {tuple(unrank_combo(rank, technique_count, length, no_immediate_repeat, no_repeat_within))
+            for rank in range(space)} == expected
+
+
+def test_no_repeat_within_longer_than_the_drill():
+    assert combo_space_size(4, 5, no_repeat_within=True) == 0
+    with pytest.raises(ComboSpaceTooSmall):
+        generate_constrained_combo_ids(1, 5, "beg", 5, no_repeat_within=True)
+
+
+def test_too_small_space_reports_the_numbers():
+    with pytest.raises(ComboSpaceTooSmall) as error:
+        generate_unique_combo_ids(17, 2, "beg", 5)
+    assert (error.value.requested, error.value.available) == (17, 16)
+
+
+@pytest.mark.parametrize("num_combos", [3, 8, 16])
+def test_unique_sparse_and_dense(num_combos):
+    # 4 techniques, length 2: 16 combos, so 3 is sparse and 8/16 are dense requests
+    combos = generate_unique_combo_ids(num_combos, 2, "beg", 5, rng=random.Random(num_combos))
+    assert len(combos) == num_combos
+    assert len({combo.tobytes() for combo in combos}) == num_combos
+    ids = set(get_sampler("beg", 5).ids)
+    assert all(set(combo) <= ids for combo in combos)
+
+
+@pytest.mark.parametrize("no_immediate_repeat,no_repeat_within", CONSTRAINTS[1:])
+def test_unique_combos_respect_repeat_constraints(no_immediate_repeat, no_repeat_within):
+    space = combo_space_size(4, 3, no_immediate_repeat, no_repeat_within)
+    combos = generate_unique_combo_ids(space, 3, "beg", 5, no_immediate_repeat=no_immediate_repeat,
+                                       no_repeat_within=no_repeat_within, rng=random.Random(3))
+    assert len({combo.tobytes() for combo in combos}) == space
+    assert all(allowed(list(combo), no_immediate_repeat, no_repeat_within) for combo in combos)
+
+
+def test_constrained_combos_never_repeat():
+    combos = generate_constrained_combo_ids(500, 4, "beg", 5, no_immediate_repeat=True, rng=random.Random(4))
+    assert all(allowed(list(combo), True, False) for combo in combos)
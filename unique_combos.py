@@ -0,0 +1,156 @@
+# File: unique_combos.py
+import random
+import sys
+from array import array
+from math import perm
+from combo_registry import get_sampler
+from techniques_data import ID_TYPECODE
+
+# Above this share of the whole constrained space, combos are drawn as distinct ranks instead of by sampling
+DENSE_FRACTION = 0.5
+# Duplicates in a row tolerated for one combo before the remaining combos are drawn as distinct ranks
+MAX_DUPLICATE_DRAWS = 32
+
+
+class ComboSpaceTooSmall(ValueError):
+    """More unique combos were asked for than the settings can produce"""
+
+    def __init__(self, requested, available):
+        super().__init__(f"Only {available} different combos exist for these settings, {requested} were requested")
+        self.requested = requested
+        self.available = available
+
+
+def combo_space_size(technique_count, combo_length, no_immediate_repeat=False, no_repeat_within=False):
+    """Number of different combos of combo_length from technique_count techniques under the constraints"""
+    if no_repeat_within:
+        return perm(technique_count, combo_length)
+    if no_immediate_repeat:
+        return technique_count * (technique_count - 1) ** (combo_length - 1) if combo_length else 1
+    return technique_count ** combo_length
+
+
+def unrank_combo(rank, technique_count, combo_length, no_immediate_repeat=False, no_repeat_within=False):
+    """The rank-th combo (as sampler positions) in a fixed ordering of the constrained space"""
+    if no_repeat_within:
+        bases = [technique_count - i for i in range(combo_length)]
+    elif no_immediate_repeat:
+        bases = [technique_count] + [technique_count - 1] * (combo_length - 1)
+    else:
+        bases = [technique_count] * combo_length
+
+    digits = []
+    for base in reversed(bases):
+        rank, digit = divmod(rank, base)
+        digits.append(digit)
+    digits.reverse()
+
+    if no_repeat_within:
+        remaining = list(range(technique_count))
+        return [remaining.pop(digit) for digit in digits]
+    if no_immediate_repeat:
+        combo = [digits[0]]
+        for digit in digits[1:]:
+            # digit counts over every technique except the previous one
+            combo.append(digit if digit < combo[-1] else digit + 1)
+        return combo
+    return digits
+
+
+def _draw_excluding(sampler, excluded, rng):
+    """One draw from the sampler's distribution restricted to techniques not in excluded (no retry loop)"""
+    position = sampler.draw(rng)
+    if position not in excluded:
+        return position
+    # A draw that hit an excluded technique is replaced by a draw from the remaining ones, in their
+    # original proportions, which is exactly the restricted distribution
+    allowed = [i for i in range(len(sampler)) if i not in excluded]
+    return rng.choices(allowed, [sampler.probabilities[i] for i in allowed])[0]
+
+
+def _sample_combo(sampler, combo_length, no_immediate_repeat, no_repeat_within, rng):
+    combo = []
+    used = set()
+    for _ in range(combo_length):
+        if no_repeat_within:
+            excluded = used
+        elif no_immediate_repeat and combo:
+            excluded = {combo[-1]}
+        else:
+            excluded = ()
+        position = _draw_excluding(sampler, excluded, rng) if excluded else sampler.draw(rng)
+        combo.append(position)
+        used.add(position)
+    return combo
+
+
+def _distinct_ranks(space, count, rng):
+    if space <= sys.maxsize:
+        yield from rng.sample(range(space), count)
+    else:
+        # Too big for random.sample, and so big that repeated ranks practically never happen
+        seen = set()
+        while len(seen) < count:
+            rank = rng.randrange(space)
+            if rank not in seen:
+                seen.add(rank)
+                yield rank
+
+
+def generate_constrained_combo_ids(num_combos, combo_length, difficulty, choice, mode="category",
+                                   no_immediate_repeat=False, no_repeat_within=False, rng=random):
+    """Generate combos (technique ID arrays) without repeated techniques, duplicate combos allowed"""
+    sampler = get_sampler(difficulty, choice, mode)
+    ids = sampler.ids
+    if not combo_space_size(len(sampler), combo_length, no_immediate_repeat, no_repeat_within):
+        raise ComboSpaceTooSmall(num_combos, 0)
+    return [array(ID_TYPECODE, [ids[position] for position in
+                                _sample_combo(sampler, combo_length, no_immediate_repeat, no_repeat_within, rng)])
+            for _ in range(num_combos)]
+
+
+def generate_unique_combo_ids(num_combos, combo_length, difficulty, choice, mode="category",
+                              no_immediate_repeat=False, no_repeat_within=False, rng=random):
+    """Generate num_combos different combos (technique ID arrays), optionally without repeated techniques
+
+    Raises ComboSpaceTooSmall when the settings can't produce that many different combos.
+    """
+    sampler = get_sampler(difficulty, choice, mode)
+    ids = sampler.ids
+    technique_count = len(sampler)
+    constraints = (no_immediate_repeat, no_repeat_within)
+    space = combo_space_size(technique_count, combo_length, *constraints)
+    if num_combos > space:
+        raise ComboSpaceTooSmall(num_combos, space)
+
+    seen = set()
+    combos = []
+
+    def add(positions):
+        combo = array(ID_TYPECODE, [ids[position] for position in positions])
+        key = combo.tobytes()
+        if key in seen:
+            return False
+        seen.add(key)
+        combos.append(combo)
+        return True
+
+    if num_combos <= space * DENSE_FRACTION:
+        # Sparse request: sample with the drill's odds and drop the few duplicates
+        duplicates = 0
+        while len(combos) < num_combos and duplicates < MAX_DUPLICATE_DRAWS:
+            if add(_sample_combo(sampler, combo_length, no_immediate_repeat, no_repeat_within, rng)):
+                duplicates = 0
+            else:
+                duplicates += 1
+
+    # Dense request (or very skewed odds): take distinct ranks of the constrained space, which can't collide
+    # with each other, and skip the ones already produced above
+    needed = num_combos - len(combos)
+    if needed:
+        ranks = _distinct_ranks(space, min(space, needed + len(combos)), rng)
+        for rank in ranks:
+            add(unrank_combo(rank, technique_count, combo_length, *constraints))
+            if len(combos) == num_combos:
+                break
+    return combos